@@ -456,6 +456,14 @@ const useWebSocket = create<WebSocketState & WebSocketActions>((set, get) => {
                 }));
               }
               break;
+            case 'alert_batch':
+              if (Array.isArray(message.data)) {
+                // Batches arrive oldest-first; newest alerts go to the front
+                set(state => ({
+                  alerts: [...message.data].reverse().concat(state.alerts).slice(0, 10)
+                }));
+              }
+              break;
             case 'welcome':
               console.log('Received welcome message:', message.data);
               break;
@@ -439,6 +439,13 @@ export const useWebSocket = create<WebSocketStore>((set, get) => ({
                 get().updateAlerts(message.data.alerts);
               }
               break;
+
+            case 'alert_batch':
+              if (Array.isArray(message.data)) {
+                // Batches arrive oldest-first; newest alerts go to the front
+                get().updateAlerts([...message.data].reverse().concat(get().alerts));
+              }
+              break;
               
             case 'threats_update':
               if (message.data && message.data.threats) {
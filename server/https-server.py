@@ -5,7 +5,7 @@ Serves both the frontend static files and WebSocket backend with SSL
 """
 
 import asyncio
-import json
+import importlib
 import os
 import signal
 import ssl
@@ -18,13 +18,16 @@ try:
 except Exception:  # pragma: no cover
     psutil = None  # Fallback if psutil is unavailable
 
+import orjson
 import websockets
 from aiohttp import web, WSMsgType
 import aiohttp_cors
 
 # Import our new modules
 from src.analyzers.advanced_threat_detector import AdvancedThreatDetector
-from src.core.alert_system import AlertSystem, AlertType, AlertSeverity
+from src.core.alert_system import (
+    AlertSystem, AlertType, AlertSeverity, start_alert_logging, stop_alert_logging
+)
 from src.core.secure_firewall import SecureFirewallManager
 from src.api.rest_api import SecurityAPI
 
@@ -33,6 +36,10 @@ HOST = os.environ.get("BYJ_HOST", "0.0.0.0")
 PORT = int(os.environ.get("BYJ_PORT", "8443"))
 FRONTEND_PORT = int(os.environ.get("BYJ_FRONTEND_PORT", "8443"))
 
+# Event loop implementation: any module exposing new_event_loop() works, e.g.
+# uvloop or an io_uring-backed loop such as rloop; "asyncio" uses the default
+EVENT_LOOP = os.environ.get("BYJ_EVENT_LOOP", "uvloop")
+
 # SSL Configuration
 SSL_CERT_PATH = os.environ.get("BYJ_SSL_CERT", "../ssl/cert.pem")
 SSL_KEY_PATH = os.environ.get("BYJ_SSL_KEY", "../ssl/key.pem")
@@ -113,7 +120,7 @@ async def websocket_handler(request):
     await ws.prepare(request)
     
     # Send welcome message
-    await ws.send_str(json.dumps({"message_type": "welcome", "data": {"message": "welcome"}}))
+    await ws.send_str(orjson.dumps({"message_type": "welcome", "data": {"message": "welcome"}}).decode())
     
     # Send initial state
     initial_payload = {
@@ -125,24 +132,24 @@ async def websocket_handler(request):
             "alerts": [],
         },
     }
-    await ws.send_str(json.dumps(initial_payload))
+    await ws.send_str(orjson.dumps(initial_payload).decode())
     
     # Periodic updates
     async def periodic_updates():
         while True:
             try:
                 await asyncio.sleep(2)
-                await ws.send_str(json.dumps({
+                await ws.send_str(orjson.dumps({
                     "message_type": "metrics_update",
                     "data": get_system_metrics(),
-                }))
+                }).decode())
                 
                 # Send connections every 5 seconds
                 if int(time.time()) % 5 == 0:
-                    await ws.send_str(json.dumps({
+                    await ws.send_str(orjson.dumps({
                         "message_type": "connections_update",
                         "data": {"active_connections": get_connections_sample(), "blocked_ips": [], "alerts": []},
-                    }))
+                    }).decode())
             except Exception:
                 break
     
@@ -152,7 +159,7 @@ async def websocket_handler(request):
         async for msg in ws:
             if msg.type == WSMsgType.TEXT:
                 try:
-                    data = json.loads(msg.data)
+                    data = orjson.loads(msg.data)
                 except Exception:
                     continue
                 
@@ -160,11 +167,11 @@ async def websocket_handler(request):
                 command = cmd.get("command")
                 
                 if command == "get_metrics":
-                    await ws.send_str(json.dumps({"message_type": "metrics_update", "data": get_system_metrics()}))
+                    await ws.send_str(orjson.dumps({"message_type": "metrics_update", "data": get_system_metrics()}).decode())
                 elif command == "get_connections":
-                    await ws.send_str(json.dumps({"message_type": "connections_update", "data": {"active_connections": get_connections_sample()}}))
+                    await ws.send_str(orjson.dumps({"message_type": "connections_update", "data": {"active_connections": get_connections_sample()}}).decode())
                 elif command == "get_alerts":
-                    await ws.send_str(json.dumps({"message_type": "alerts_update", "data": {"alerts": []}}))
+                    await ws.send_str(orjson.dumps({"message_type": "alerts_update", "data": {"alerts": []}}).decode())
     finally:
         updater_task.cancel()
         try:
@@ -250,6 +257,7 @@ async def main():
         print(f"[ERROR] SSL key not found at {SSL_KEY_PATH}")
         return
     
+    start_alert_logging()
     app = await create_app()
     
     # Create SSL context
@@ -257,10 +265,11 @@ async def main():
     ssl_context.load_cert_chain(SSL_CERT_PATH, SSL_KEY_PATH)
     
     # Start the server
-    runner = web.AppRunner(app)
+    # Access logging formats a line per request; the API is polled heavily
+    runner = web.AppRunner(app, access_log=None)
     await runner.setup()
     
-    site = web.TCPSite(runner, HOST, FRONTEND_PORT, ssl_context=ssl_context)
+    site = web.TCPSite(runner, HOST, FRONTEND_PORT, ssl_context=ssl_context, backlog=2048)
     await site.start()
     
     # Keep the server running
@@ -270,9 +279,34 @@ async def main():
         print("\n[BYJ] Shutting down HTTPS server...")
     finally:
         await runner.cleanup()
+        stop_alert_logging()
+
+def run_with_event_loop(coro):
+    """Run coro on the event loop selected by BYJ_EVENT_LOOP"""
+    loop_factory = None
+    if EVENT_LOOP != "asyncio":
+        try:
+            loop_factory = importlib.import_module(EVENT_LOOP).new_event_loop
+        except (ImportError, AttributeError):
+            print(f"[BYJ] Event loop '{EVENT_LOOP}' unavailable, using asyncio")
+    if hasattr(asyncio, "Runner"):  # Python 3.11+
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(coro)
+    if loop_factory is None:
+        return asyncio.run(coro)
+    loop = loop_factory()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_with_event_loop(main())
     except KeyboardInterrupt:
         pass
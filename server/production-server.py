@@ -5,7 +5,8 @@ Serves both the frontend static files and WebSocket backend
 """
 
 import asyncio
-import json
+import importlib
+import multiprocessing
 import os
 import signal
 import time
@@ -17,13 +18,16 @@ try:
 except Exception:  # pragma: no cover
     psutil = None  # Fallback if psutil is unavailable
 
+import orjson
 import websockets
 from aiohttp import web, WSMsgType
 import aiohttp_cors
 
 # Import our new modules
 from src.analyzers.advanced_threat_detector import AdvancedThreatDetector
-from src.core.alert_system import AlertSystem, AlertType, AlertSeverity
+from src.core.alert_system import (
+    AlertSystem, AlertType, AlertSeverity, start_alert_logging, stop_alert_logging
+)
 from src.core.secure_firewall import SecureFirewallManager
 from src.api.rest_api import SecurityAPI
 
@@ -32,6 +36,14 @@ HOST = os.environ.get("BYJ_HOST", "0.0.0.0")
 PORT = int(os.environ.get("BYJ_PORT", "8766"))
 FRONTEND_PORT = int(os.environ.get("BYJ_FRONTEND_PORT", "8080"))
 
+# Event loop implementation: any module exposing new_event_loop() works, e.g.
+# uvloop or an io_uring-backed loop such as rloop; "asyncio" uses the default
+EVENT_LOOP = os.environ.get("BYJ_EVENT_LOOP", "uvloop")
+
+# Worker processes sharing the frontend port via SO_REUSEPORT ("auto" = one per CPU).
+# Alert, blocklist and login state is per process, so keep 1 unless that is acceptable
+WORKERS = os.environ.get("BYJ_WORKERS", "1")
+
 # Paths
 FRONTEND_DIST_PATH = Path(__file__).parent.parent / "frontend" / "bigyellowjacket-ui" / "dist"
 
@@ -108,7 +120,7 @@ async def websocket_handler(request):
     await ws.prepare(request)
     
     # Send welcome message
-    await ws.send_str(json.dumps({"message_type": "welcome", "data": {"message": "welcome"}}))
+    await ws.send_str(orjson.dumps({"message_type": "welcome", "data": {"message": "welcome"}}).decode())
     
     # Send initial state
     initial_payload = {
@@ -120,24 +132,24 @@ async def websocket_handler(request):
             "alerts": [],
         },
     }
-    await ws.send_str(json.dumps(initial_payload))
+    await ws.send_str(orjson.dumps(initial_payload).decode())
     
     # Periodic updates
     async def periodic_updates():
         while True:
             try:
                 await asyncio.sleep(2)
-                await ws.send_str(json.dumps({
+                await ws.send_str(orjson.dumps({
                     "message_type": "metrics_update",
                     "data": get_system_metrics(),
-                }))
+                }).decode())
                 
                 # Send connections every 5 seconds
                 if int(time.time()) % 5 == 0:
-                    await ws.send_str(json.dumps({
+                    await ws.send_str(orjson.dumps({
                         "message_type": "connections_update",
                         "data": {"active_connections": get_connections_sample(), "blocked_ips": [], "alerts": []},
-                    }))
+                    }).decode())
             except Exception:
                 break
     
@@ -147,7 +159,7 @@ async def websocket_handler(request):
         async for msg in ws:
             if msg.type == WSMsgType.TEXT:
                 try:
-                    data = json.loads(msg.data)
+                    data = orjson.loads(msg.data)
                 except Exception:
                     continue
                 
@@ -155,11 +167,11 @@ async def websocket_handler(request):
                 command = cmd.get("command")
                 
                 if command == "get_metrics":
-                    await ws.send_str(json.dumps({"message_type": "metrics_update", "data": get_system_metrics()}))
+                    await ws.send_str(orjson.dumps({"message_type": "metrics_update", "data": get_system_metrics()}).decode())
                 elif command == "get_connections":
-                    await ws.send_str(json.dumps({"message_type": "connections_update", "data": {"active_connections": get_connections_sample()}}))
+                    await ws.send_str(orjson.dumps({"message_type": "connections_update", "data": {"active_connections": get_connections_sample()}}).decode())
                 elif command == "get_alerts":
-                    await ws.send_str(json.dumps({"message_type": "alerts_update", "data": {"alerts": []}}))
+                    await ws.send_str(orjson.dumps({"message_type": "alerts_update", "data": {"alerts": []}}).decode())
     finally:
         updater_task.cancel()
         try:
@@ -188,7 +200,7 @@ async def api_threats_handler(request):
 async def api_block_ip_handler(request):
     """Simple API endpoint for blocking IPs"""
     try:
-        data = await request.json()
+        data = await request.json(loads=orjson.loads)
         ip = data.get('ip', '')
         print(f"Blocking IP: {ip}")
         return web.json_response({
@@ -257,19 +269,21 @@ async def create_app():
     
     return app
 
-async def main():
+async def main(reuse_port: bool = False):
     """Main function to run the server"""
     print(f"[BYJ] Starting production server on http://{HOST}:{FRONTEND_PORT}")
     print(f"[BYJ] WebSocket server on ws://{HOST}:{PORT}")
     print(f"[BYJ] Frontend files from: {FRONTEND_DIST_PATH}")
     
+    start_alert_logging()
     app = await create_app()
     
     # Start the server
-    runner = web.AppRunner(app)
+    # Access logging formats a line per request; the API is polled heavily
+    runner = web.AppRunner(app, access_log=None)
     await runner.setup()
     
-    site = web.TCPSite(runner, HOST, FRONTEND_PORT)
+    site = web.TCPSite(runner, HOST, FRONTEND_PORT, backlog=2048, reuse_port=reuse_port)
     await site.start()
     
     # Keep the server running
@@ -279,9 +293,67 @@ async def main():
         print("\n[BYJ] Shutting down server...")
     finally:
         await runner.cleanup()
+        stop_alert_logging()
 
-if __name__ == "__main__":
+def run_with_event_loop(coro):
+    """Run coro on the event loop selected by BYJ_EVENT_LOOP"""
+    loop_factory = None
+    if EVENT_LOOP != "asyncio":
+        try:
+            loop_factory = importlib.import_module(EVENT_LOOP).new_event_loop
+        except (ImportError, AttributeError):
+            print(f"[BYJ] Event loop '{EVENT_LOOP}' unavailable, using asyncio")
+    if hasattr(asyncio, "Runner"):  # Python 3.11+
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(coro)
+    if loop_factory is None:
+        return asyncio.run(coro)
+    loop = loop_factory()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+def get_worker_count() -> int:
+    """Resolve BYJ_WORKERS to a process count"""
+    if WORKERS == "auto":
+        return os.cpu_count() or 1
+    return max(int(WORKERS), 1)
+
+def run_worker(worker_id: int):
+    """Run one server process pinned to a single CPU"""
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[worker_id % len(cpus)]})
     try:
-        asyncio.run(main())
+        run_with_event_loop(main(reuse_port=True))
     except KeyboardInterrupt:
         pass
+
+def run_workers(count: int):
+    """Start count worker processes and wait for them to exit"""
+    print(f"[BYJ] Starting {count} worker processes")
+    workers = [multiprocessing.Process(target=run_worker, args=(i,)) for i in range(count)]
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.join()
+
+if __name__ == "__main__":
+    worker_count = get_worker_count()
+    if worker_count > 1:
+        run_workers(worker_count)
+    else:
+        try:
+            run_with_event_loop(main())
+        except KeyboardInterrupt:
+            pass
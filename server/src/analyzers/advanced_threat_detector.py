@@ -10,7 +10,7 @@ import re
 import time
 from collections import defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 import ipaddress
 import hashlib
 
@@ -53,7 +53,7 @@ class AdvancedThreatDetector:
         }
         
         # Known malicious IPs and patterns
-        self.malicious_ips = set()
+        self.malicious_ips: Set[str] = set()
         self.suspicious_ips = defaultdict(int)
         self.attack_attempts = defaultdict(list)
         
@@ -82,6 +82,7 @@ class AdvancedThreatDetector:
         """Analyze network packet for threats"""
         threats = []
         risk_score = 0
+        timestamp = datetime.now().isoformat()
         
         # Convert packet to string for pattern matching
         packet_str = packet_data.decode('utf-8', errors='ignore').lower()
@@ -95,7 +96,7 @@ class AdvancedThreatDetector:
                     'description': config['description'],
                     'src_ip': src_ip,
                     'dst_ip': dst_ip,
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': timestamp,
                     'confidence': 0.9
                 }
                 threats.append(threat)
@@ -115,7 +116,7 @@ class AdvancedThreatDetector:
         return {
             'threats': threats,
             'risk_score': risk_score,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'src_ip': src_ip,
             'dst_ip': dst_ip
         }
@@ -232,6 +233,16 @@ class AdvancedThreatDetector:
             print(f"[ERROR] Invalid IP address: {ip}")
             return False
     
+    def unblock_ip(self, ip: str) -> bool:
+        """Remove IP address from the blocked list"""
+        try:
+            self.malicious_ips.remove(ip)
+        except KeyError:
+            return False
+        
+        print(f"[UNBLOCK] Unblocked IP {ip}")
+        return True
+    
     def get_threat_summary(self) -> Dict[str, Any]:
         """Get summary of current threat landscape"""
         current_time = time.time()
@@ -295,11 +306,12 @@ class AdvancedThreatDetector:
     def _get_top_threat_ips(self) -> List[Dict[str, Any]]:
         """Get top threat IPs by activity"""
         ip_scores = []
+        cutoff_time = time.time() - 3600
         
         for ip, attempts in self.attack_attempts.items():
             recent_attempts = len([
                 t for t in attempts 
-                if t > time.time() - 3600
+                if t > cutoff_time
             ])
             if recent_attempts > 0:
                 ip_scores.append({
@@ -5,7 +5,7 @@ import re
 import ipaddress
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 from src.utils.logger import logger
 
 class ThreatIntelligenceUpdater:
@@ -40,24 +40,45 @@ class ThreatIntelligenceUpdater:
         self.database_path = Path("data/threat_intel/database.json")
         self.backup_path = Path("data/threat_intel/database_backup.json")
         
+        # HTTP session shared across sources and update cycles
+        self._session: Optional[aiohttp.ClientSession] = None
+        
     async def start_updater(self):
         """Start the threat intelligence updater"""
         self.running = True
         logger.info("Starting threat intelligence updater...")
         
-        while self.running:
-            try:
-                await self.update_threat_intelligence()
-                await asyncio.sleep(self.update_interval)
-            except Exception as e:
-                logger.error(f"Error in threat intelligence updater: {e}")
-                await asyncio.sleep(300)  # Wait 5 minutes on error
+        try:
+            while self.running:
+                try:
+                    await self.update_threat_intelligence()
+                    await asyncio.sleep(self.update_interval)
+                except Exception as e:
+                    logger.error(f"Error in threat intelligence updater: {e}")
+                    await asyncio.sleep(300)  # Wait 5 minutes on error
+        finally:
+            await self.close()
                 
     def stop_updater(self):
         """Stop the threat intelligence updater"""
         self.running = False
         logger.info("Stopping threat intelligence updater...")
         
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=60),
+                headers={'User-Agent': 'BigYellowJacket-ThreatIntel/1.0'}
+            )
+        return self._session
+        
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
     async def update_threat_intelligence(self):
         """Update threat intelligence from all sources"""
         try:
@@ -129,18 +150,13 @@ class ThreatIntelligenceUpdater:
     async def fetch_from_source(self, url: str) -> str:
         """Fetch data from a threat intelligence source"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url, 
-                    timeout=aiohttp.ClientTimeout(total=60),
-                    headers={'User-Agent': 'BigYellowJacket-ThreatIntel/1.0'}
-                ) as response:
-                    if response.status == 200:
-                        return await response.text()
-                    else:
-                        logger.warning(f"HTTP {response.status} from {url}")
-                        return None
-                        
+            async with self._get_session().get(url) as response:
+                if response.status == 200:
+                    return await response.text()
+                else:
+                    logger.warning(f"HTTP {response.status} from {url}")
+                    return None
+                    
         except Exception as e:
             logger.error(f"Error fetching from {url}: {e}")
             return None
@@ -5,26 +5,323 @@ Comprehensive API endpoints for all platform functionality
 """
 
 import asyncio
-import json
+import base64
+import csv
+import functools
+import gzip
+import hashlib
+import io
+import logging
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+import orjson
 from aiohttp import web, web_request
 from aiohttp_cors import setup as cors_setup, ResourceOptions
 import aiohttp_cors
 
+try:
+    import simdjson  # type: ignore
+except Exception:  # pragma: no cover
+    simdjson = None  # Fallback to orjson when pysimdjson is unavailable
+
 from ..analyzers.advanced_threat_detector import AdvancedThreatDetector
 from ..core.alert_system import AlertSystem, AlertType, AlertSeverity
 
+logger = logging.getLogger(__name__)
+
+# Largest JSON request body the API will parse
+MAX_JSON_BODY = 64 * 1024
+
+# Responses smaller than this are not worth compressing
+COMPRESSION_MIN_BYTES = 1024
+
+# Rows buffered per write when streaming report exports
+EXPORT_CHUNK_ROWS = 500
+
+# Side-effect alerts are created in batches of up to this many ...
+ALERT_BATCH_SIZE = 64
+# ... or whatever arrived within this many seconds of the first one
+ALERT_BATCH_WINDOW = 0.005
+
+# Seconds a polled summary/stats response is reused for the same path
+RESPONSE_CACHE_TTL = 2.0
+# Most recently used paths kept in the response cache
+RESPONSE_CACHE_MAX_ENTRIES = 32
+
+# gzip level for the alert history, which is re-compressed whenever it changes
+ALERT_HISTORY_GZIP_LEVEL = 6
+
+# Placeholder patched with the current time when serving cached payloads
+TIMESTAMP_PLACEHOLDER = b'__timestamp__'
+
+
+# Static payloads served by SecurityAPI; serialized once in SecurityAPI.__init__
+SYSTEM_COMPONENTS = {
+    'threat_detection': 'active',
+    'alert_system': 'active',
+    'database': 'connected',
+    'websocket': 'connected'
+}
+
+NETWORK_TOPOLOGY = {
+    'nodes': [
+        {'id': 'firewall', 'type': 'firewall', 'status': 'active'},
+        {'id': 'router', 'type': 'router', 'status': 'active'},
+        {'id': 'server1', 'type': 'server', 'status': 'active'},
+        {'id': 'server2', 'type': 'server', 'status': 'active'},
+        {'id': 'client1', 'type': 'client', 'status': 'active'}
+    ],
+    'links': [
+        {'source': 'firewall', 'target': 'router', 'status': 'up'},
+        {'source': 'router', 'target': 'server1', 'status': 'up'},
+        {'source': 'router', 'target': 'server2', 'status': 'up'},
+        {'source': 'router', 'target': 'client1', 'status': 'up'}
+    ]
+}
+
+ANALYTICS_DATA = {
+    'threat_trends': [
+        {'time': '00:00', 'threats': 5},
+        {'time': '04:00', 'threats': 3},
+        {'time': '08:00', 'threats': 12},
+        {'time': '12:00', 'threats': 8},
+        {'time': '16:00', 'threats': 15},
+        {'time': '20:00', 'threats': 7}
+    ],
+    'top_threat_ips': [
+        {'ip': '192.168.1.100', 'count': 45, 'severity': 'critical'},
+        {'ip': '10.0.0.50', 'count': 32, 'severity': 'high'},
+        {'ip': '172.16.0.25', 'count': 28, 'severity': 'medium'}
+    ],
+    'geographic_data': [
+        {'country': 'United States', 'threats': 45, 'connections': 120},
+        {'country': 'China', 'threats': 32, 'connections': 85},
+        {'country': 'Russia', 'threats': 28, 'connections': 65}
+    ]
+}
+
+DEFAULT_CONFIG = {
+    'threat_detection': {
+        'enabled': True,
+        'sensitivity': 'medium',
+        'auto_block': True
+    },
+    'alerting': {
+        'email_enabled': False,
+        'webhook_enabled': False,
+        'thresholds': {
+            'critical': 1,
+            'high': 5,
+            'medium': 10
+        }
+    },
+    'monitoring': {
+        'scan_interval': 2,
+        'retention_days': 30,
+        'log_level': 'info'
+    }
+}
+
+MOCK_USERS = [
+    {'id': 1, 'username': 'phoenix_7x', 'role': 'admin', 'active': True, 'email': 'phoenix@bigyellowjacket.com'},
+    {'id': 2, 'username': 'storm_delta', 'role': 'user', 'active': True, 'email': 'storm@bigyellowjacket.com'},
+    {'id': 3, 'username': 'cyber_wolf', 'role': 'user', 'active': True, 'email': 'wolf@bigyellowjacket.com'},
+    {'id': 4, 'username': 'shadow_ops', 'role': 'user', 'active': False, 'email': 'shadow@bigyellowjacket.com'}
+]
+
+# Identifiers for the synthetic connection list, formatted once at import
+CONNECTION_IDS = tuple(f'conn_{i}' for i in range(1, 11))
+CONNECTION_SOURCES = tuple(f'192.168.1.{i}' for i in range(1, 11))
+
+# Enum members by wire value, for request parsing without Enum() lookups
+ALERT_TYPES = {member.value: member for member in AlertType}
+ALERT_SEVERITIES = {member.value: member for member in AlertSeverity}
+
+
+def build_mock_connections(timestamp: str) -> List[Dict[str, Any]]:
+    """Build the synthetic connection list served by /api/connections"""
+    return [
+        {
+            'id': conn_id,
+            'src_ip': src_ip,
+            'dst_ip': '8.8.8.8',
+            'src_port': 80 + i,
+            'dst_port': 80,
+            'protocol': 'TCP',
+            'status': 'ESTABLISHED',
+            'bytes_sent': 1024 * i,
+            'bytes_received': 2048 * i,
+            'timestamp': timestamp
+        }
+        for conn_id, src_ip, i in zip(CONNECTION_IDS, CONNECTION_SOURCES, range(1, 11))
+    ]
+
+def orjson_response(data: Any, status: int = 200) -> web.Response:
+    """Serialize data with orjson into a JSON response"""
+    return web.Response(body=orjson.dumps(data), status=status, content_type='application/json')
+
+
+def make_etag(body: bytes) -> str:
+    """Build a strong ETag for a response body"""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+def gzip_etag(etag: str) -> str:
+    """Derive the strong ETag of the gzip representation of a body"""
+    return etag[:-1] + '-gzip"'
+
+
+def preserialize(data: Any, compresslevel: int = 9) -> Tuple[bytes, str, Optional[bytes]]:
+    """Serialize a static payload once, along with its ETag and gzip variant"""
+    body = orjson.dumps(data)
+    gzipped = gzip.compress(body, compresslevel) if len(body) > COMPRESSION_MIN_BYTES else None
+    return body, make_etag(body), gzipped
+
+
+def cached_json_response(body: bytes, etag: Optional[str] = None, status: int = 200) -> web.Response:
+    """Wrap an already serialized JSON body in a response"""
+    headers = {'ETag': etag} if etag else None
+    return web.Response(body=body, status=status, headers=headers, content_type='application/json')
+
+
+def preserialized_response(request: web_request.Request,
+                           payload: Tuple[bytes, str, Optional[bytes]]) -> web.Response:
+    """Serve a preserialize() payload, using its gzip variant when accepted"""
+    body, etag, gzipped = payload
+    if gzipped is None:
+        return cached_json_response(body, etag)
+    headers = {'Vary': 'Accept-Encoding'}
+    if 'gzip' not in request.headers.get('Accept-Encoding', ''):
+        headers['ETag'] = etag
+        return web.Response(body=body, headers=headers, content_type='application/json')
+    # Distinct strong ETag per representation
+    headers['ETag'] = gzip_etag(etag)
+    headers['Content-Encoding'] = 'gzip'
+    return web.Response(body=gzipped, headers=headers, content_type='application/json')
+
+
+def ttl_cached(handler):
+    """Reuse a handler's 200 response body for RESPONSE_CACHE_TTL seconds per path"""
+    @functools.wraps(handler)
+    async def wrapper(self, request: web_request.Request) -> web.Response:
+        # Wrapped handlers ignore the query string, so it is not part of the key
+        key = request.path
+        now = time.monotonic()
+        cache = self._response_cache
+        entry = cache.get(key)
+        if entry is not None:
+            if now - entry[0] < RESPONSE_CACHE_TTL:
+                cache.move_to_end(key)
+                return cached_json_response(entry[1], entry[2])
+            del cache[key]
+        
+        response = await handler(self, request)
+        if response.status == 200 and isinstance(response.body, (bytes, bytearray)):
+            etag = response.headers.get('ETag') or make_etag(response.body)
+            response.headers['ETag'] = etag
+            cache[key] = (now, response.body, etag)
+            if len(cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+        return response
+    return wrapper
+
+
+@web.middleware
+async def etag_middleware(request: web_request.Request, handler) -> web.StreamResponse:
+    """Tag GET responses and answer matching If-None-Match with 304"""
+    response = await handler(request)
+    if (request.method == 'GET'
+            and response.status == 200
+            and isinstance(response, web.Response)
+            and isinstance(response.body, (bytes, bytearray))):
+        etag = response.headers.get('ETag') or make_etag(response.body)
+        response.headers['ETag'] = etag
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match:
+            if if_none_match.strip() == '*':
+                return web.Response(status=304, headers={'ETag': etag})
+            tags = {tag.strip() for tag in if_none_match.split(',')}
+            if etag in tags:
+                return web.Response(status=304, headers={'ETag': etag})
+            # Clients revalidate gzipped bodies with the tag compression_middleware issued
+            if gzip_etag(etag) in tags:
+                return web.Response(status=304, headers={'ETag': gzip_etag(etag),
+                                                         'Vary': 'Accept-Encoding'})
+    return response
+
+
+@web.middleware
+async def compression_middleware(request: web_request.Request, handler) -> web.StreamResponse:
+    """Gzip large response bodies for clients that accept it"""
+    response = await handler(request)
+    if (isinstance(response, web.Response)
+            and isinstance(response.body, (bytes, bytearray))
+            and len(response.body) > COMPRESSION_MIN_BYTES
+            and 'Content-Encoding' not in response.headers):
+        response.headers['Vary'] = 'Accept-Encoding'
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            # Distinct strong ETag per representation, as in preserialized_response
+            etag = response.headers.get('ETag')
+            if etag and etag.endswith('"') and not etag.startswith('W/'):
+                response.headers['ETag'] = gzip_etag(etag)
+            response.enable_compression(web.ContentCoding.gzip)
+    return response
+
 class SecurityAPI:
     """REST API for Big Yellow Jacket Security platform"""
     
     def __init__(self):
         self.threat_detector = AdvancedThreatDetector()
         self.alert_system = AlertSystem()
-        self.app = web.Application()
+        self.app = web.Application(middlewares=[
+            web.normalize_path_middleware(append_slash=False, merge_slashes=True),
+            compression_middleware,
+            etag_middleware,
+        ])
         # In-memory login attempts buffer (also persisted to disk)
         self.login_attempts: List[Dict[str, Any]] = []
+        # Per-minute buckets reused by get_login_stats on every poll
+        self._login_buckets: List[Dict[str, Any]] = [
+            {'time': '', 'success': 0, 'failed': 0} for _ in range(60)
+        ]
+        self.login_log_file = Path(__file__).resolve().parents[2] / 'data' / 'reports' / 'login_attempts.jsonl'
+        try:
+            self.login_log_file.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            # Non-fatal; record_login_attempt tolerates persistence failures
+            pass
+        # Reused by _read_json_fields; documents are consumed before the next await
+        self._json_parser = simdjson.Parser() if simdjson is not None else None
+        # Static payloads are serialized once; timestamped ones keep a placeholder
+        self._connections_template = orjson.dumps(
+            build_mock_connections(TIMESTAMP_PLACEHOLDER.decode())
+        )
+        self._status_template = orjson.dumps({
+            'status': 'operational',
+            'components': SYSTEM_COMPONENTS,
+            'timestamp': TIMESTAMP_PLACEHOLDER.decode()
+        })
+        self._topology = preserialize(NETWORK_TOPOLOGY)
+        self._analytics = preserialize(ANALYTICS_DATA)
+        self._config = preserialize(DEFAULT_CONFIG)
+        self._users = preserialize(MOCK_USERS)
+        self._user_payloads = {str(user['id']): preserialize(user) for user in MOCK_USERS}
+        # path -> (monotonic time, body, ETag) for ttl_cached handlers, least recently used first
+        self._response_cache: 'OrderedDict[str, Tuple[float, bytes, str]]' = OrderedDict()
+        # preserialize() payload of the alert history, rebuilt when the alert system's version moves
+        self._alert_history: Optional[Tuple[bytes, str, Optional[bytes]]] = None
+        self._alert_history_version = -1
+        # Alerts raised as a side effect of a request are created off the request path
+        self._alert_queue: asyncio.Queue = asyncio.Queue()
+        self._alert_drainer: Optional[asyncio.Task] = None
+        # Wall-clock ISO string for response payloads, refreshed once per second
+        self._ts = ''
+        self._ts_bytes = b''
+        self._clock: Optional[asyncio.Task] = None
+        self.app.on_cleanup.append(self._stop_background_tasks)
         self.setup_routes()
         self.setup_cors()
     
@@ -39,90 +336,185 @@ class SecurityAPI:
             )
         })
         
-        # Add CORS to all routes
-        for route in list(self.app.router.routes()):
-            cors.add(route)
+        # Add CORS once per resource rather than once per route
+        for resource in list(self.app.router.resources()):
+            cors.add(resource)
     
     def setup_routes(self):
         """Setup all API routes"""
-        # System endpoints
-        self.app.router.add_get('/api/health', self.health_check)
-        self.app.router.add_get('/api/status', self.system_status)
-        self.app.router.add_get('/api/metrics', self.system_metrics)
-        
-        # Threat detection endpoints
-        self.app.router.add_get('/api/threats', self.get_threats)
-        self.app.router.add_get('/api/threats/summary', self.get_threat_summary)
-        self.app.router.add_post('/api/threats/analyze', self.analyze_packet)
-        self.app.router.add_post('/api/threats/block-ip', self.block_ip)
-        self.app.router.add_delete('/api/threats/unblock-ip/{ip}', self.unblock_ip)
-        
-        # Alert endpoints
-        self.app.router.add_get('/api/alerts', self.get_alerts)
-        self.app.router.add_get('/api/alerts/active', self.get_active_alerts)
-        self.app.router.add_get('/api/alerts/stats', self.get_alert_stats)
-        self.app.router.add_post('/api/alerts/{alert_id}/acknowledge', self.acknowledge_alert)
-        self.app.router.add_post('/api/alerts/{alert_id}/resolve', self.resolve_alert)
-        self.app.router.add_post('/api/alerts/create', self.create_alert)
-        
-        # Network monitoring endpoints
-        self.app.router.add_get('/api/connections', self.get_connections)
-        self.app.router.add_get('/api/connections/stats', self.get_connection_stats)
-        self.app.router.add_get('/api/network/topology', self.get_network_topology)
-        
-        # Security reports endpoints
-        self.app.router.add_get('/api/reports/threat', self.get_threat_report)
-        self.app.router.add_get('/api/reports/security', self.get_security_report)
-        self.app.router.add_get('/api/reports/export/{format}', self.export_report)
-        
-        # Configuration endpoints
-        self.app.router.add_get('/api/config', self.get_config)
-        self.app.router.add_post('/api/config', self.update_config)
-        self.app.router.add_get('/api/config/threat-rules', self.get_threat_rules)
-        self.app.router.add_post('/api/config/threat-rules', self.update_threat_rules)
-        
-        # User management endpoints
-        self.app.router.add_get('/api/users', self.get_users)
-        self.app.router.add_post('/api/users', self.create_user)
-        self.app.router.add_get('/api/users/{user_id}', self.get_user)
-        self.app.router.add_put('/api/users/{user_id}', self.update_user)
-        self.app.router.add_delete('/api/users/{user_id}', self.delete_user)
-        
-        # Dashboard data endpoints
-        self.app.router.add_get('/api/dashboard/overview', self.get_dashboard_overview)
-        self.app.router.add_get('/api/dashboard/real-time', self.get_realtime_data)
-        self.app.router.add_get('/api/dashboard/analytics', self.get_analytics_data)
+        self.app.add_routes([
+            # System endpoints
+            web.get('/api/health', self.health_check),
+            web.get('/api/status', self.system_status),
+            web.get('/api/metrics', self.system_metrics),
 
-        # Authentication telemetry endpoints
-        self.app.router.add_post('/api/auth/login-attempt', self.record_login_attempt)
-        self.app.router.add_get('/api/auth/login-stats', self.get_login_stats)
+            # Threat detection endpoints
+            web.get('/api/threats', self.get_threats),
+            web.get('/api/threats/summary', self.get_threat_summary),
+            web.post('/api/threats/analyze', self.analyze_packet),
+            web.post('/api/threats/block-ip', self.block_ip),
+            web.delete('/api/threats/unblock-ip/{ip}', self.unblock_ip),
+
+            # Alert endpoints
+            web.get('/api/alerts', self.get_alerts),
+            web.get('/api/alerts/active', self.get_active_alerts),
+            web.get('/api/alerts/stats', self.get_alert_stats),
+            web.post('/api/alerts/{alert_id}/acknowledge', self.acknowledge_alert),
+            web.post('/api/alerts/{alert_id}/resolve', self.resolve_alert),
+            web.post('/api/alerts/create', self.create_alert),
+
+            # Network monitoring endpoints
+            web.get('/api/connections', self.get_connections),
+            web.get('/api/connections/stats', self.get_connection_stats),
+            web.get('/api/network/topology', self.get_network_topology),
+
+            # Security reports endpoints
+            web.get('/api/reports/threat', self.get_threat_report),
+            web.get('/api/reports/security', self.get_security_report),
+            web.get('/api/reports/export/{format}', self.export_report),
+
+            # Configuration endpoints
+            web.get('/api/config', self.get_config),
+            web.post('/api/config', self.update_config),
+            web.get('/api/config/threat-rules', self.get_threat_rules),
+            web.post('/api/config/threat-rules', self.update_threat_rules),
+
+            # User management endpoints
+            web.get('/api/users', self.get_users),
+            web.post('/api/users', self.create_user),
+            web.get('/api/users/{user_id}', self.get_user),
+            web.put('/api/users/{user_id}', self.update_user),
+            web.delete('/api/users/{user_id}', self.delete_user),
+
+            # Dashboard data endpoints
+            web.get('/api/dashboard/overview', self.get_dashboard_overview),
+            web.get('/api/dashboard/real-time', self.get_realtime_data),
+            web.get('/api/dashboard/analytics', self.get_analytics_data),
+
+            # Authentication telemetry endpoints
+            web.post('/api/auth/login-attempt', self.record_login_attempt),
+            web.get('/api/auth/login-stats', self.get_login_stats),
+        ])
+    
+    async def _read_body(self, request: web_request.Request, max_bytes: int = MAX_JSON_BODY) -> bytes:
+        """Read a request body, rejecting oversized payloads"""
+        if request.content_length is not None and request.content_length > max_bytes:
+            raise web.HTTPRequestEntityTooLarge(max_bytes, request.content_length)
+        body = await request.read()
+        if len(body) > max_bytes:
+            raise web.HTTPRequestEntityTooLarge(max_bytes, len(body))
+        return body
+    
+    async def _read_json(self, request: web_request.Request, max_bytes: int = MAX_JSON_BODY) -> Any:
+        """Read and parse a JSON request body, rejecting oversized payloads"""
+        return orjson.loads(await self._read_body(request, max_bytes))
+    
+    async def _read_json_fields(self, request: web_request.Request, fields: Tuple[str, ...],
+                                max_bytes: int = MAX_JSON_BODY) -> Dict[str, Any]:
+        """Read only the given top-level fields of a JSON object body"""
+        body = await self._read_body(request, max_bytes)
+        if self._json_parser is None:
+            data = orjson.loads(body)
+            if not isinstance(data, dict):
+                raise ValueError('JSON object expected')
+            return {key: data[key] for key in fields if key in data}
+        
+        # simdjson only materializes the values we actually look up
+        doc = self._json_parser.parse(body)
+        if not isinstance(doc, simdjson.Object):
+            raise ValueError('JSON object expected')
+        result = {}
+        for key in fields:
+            if key not in doc:
+                continue
+            value = doc[key]
+            if isinstance(value, simdjson.Object):
+                value = value.as_dict()
+            elif isinstance(value, simdjson.Array):
+                value = value.as_list()
+            result[key] = value
+        return result
+    
+    def _queue_alert(self, *args, **kwargs):
+        """Queue an alert for creation by the background batch drainer"""
+        self._alert_queue.put_nowait((args, kwargs))
+        if self._alert_drainer is None or self._alert_drainer.done():
+            self._alert_drainer = asyncio.create_task(self._drain_alerts())
+    
+    async def _drain_alerts(self):
+        """Create queued alerts in batches"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._alert_queue.get()]
+            deadline = loop.time() + ALERT_BATCH_WINDOW
+            while len(batch) < ALERT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._alert_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            for args, kwargs in batch:
+                try:
+                    await self.alert_system.create_alert(*args, **kwargs)
+                except Exception:
+                    logger.exception("[ERROR] Queued alert creation failed")
+            self._response_cache.clear()
+    
+    def _now(self) -> str:
+        """Current time as an ISO string, at one second resolution"""
+        if self._clock is None or self._clock.done():
+            self._refresh_clock()
+            self._clock = asyncio.create_task(self._tick())
+        return self._ts
+    
+    def _now_bytes(self) -> bytes:
+        """_now() encoded for patching into preserialized templates"""
+        self._now()
+        return self._ts_bytes
+    
+    def _refresh_clock(self):
+        """Re-read the wall clock into the cached timestamp"""
+        self._ts = datetime.now().isoformat()
+        self._ts_bytes = self._ts.encode()
+    
+    async def _tick(self):
+        """Refresh the cached timestamp once per second"""
+        while True:
+            await asyncio.sleep(1)
+            self._refresh_clock()
+    
+    async def _stop_background_tasks(self, app: web.Application):
+        """Cancel the alert drainer and clock on application cleanup"""
+        for task in (self._alert_drainer, self._clock):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
     
     # System endpoints
     async def health_check(self, request: web_request.Request) -> web.Response:
         """Health check endpoint"""
-        return web.json_response({
+        return orjson_response({
             'status': 'healthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._now(),
             'version': '1.0.0',
             'uptime': time.time()
         })
     
     async def system_status(self, request: web_request.Request) -> web.Response:
         """Get system status"""
-        return web.json_response({
-            'status': 'operational',
-            'components': {
-                'threat_detection': 'active',
-                'alert_system': 'active',
-                'database': 'connected',
-                'websocket': 'connected'
-            },
-            'timestamp': datetime.now().isoformat()
-        })
+        return cached_json_response(self._status_template.replace(
+            TIMESTAMP_PLACEHOLDER, self._now_bytes()
+        ))
     
     async def system_metrics(self, request: web_request.Request) -> web.Response:
         """Get system metrics"""
-        return web.json_response({
+        return orjson_response({
             'cpu_usage': 45.2,
             'memory_usage': 67.8,
             'disk_usage': 23.1,
@@ -130,54 +522,71 @@ class SecurityAPI:
             'active_connections': 28,
             'threats_detected': 15,
             'alerts_active': 3,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._now()
         })
     
     # Threat detection endpoints
+    async def _build_threats(self) -> Dict[str, Any]:
+        """Build the threat payload shared by threat and dashboard endpoints"""
+        return self.threat_detector.get_threat_summary()
+    
     async def get_threats(self, request: web_request.Request) -> web.Response:
         """Get all threats"""
-        threats = self.threat_detector.get_threat_summary()
-        return web.json_response(threats)
+        return orjson_response(await self._build_threats())
     
+    @ttl_cached
     async def get_threat_summary(self, request: web_request.Request) -> web.Response:
         """Get threat summary"""
         summary = self.threat_detector.get_threat_summary()
-        return web.json_response(summary)
+        return orjson_response(summary)
     
     async def analyze_packet(self, request: web_request.Request) -> web.Response:
         """Analyze packet for threats"""
         try:
-            data = await request.json()
-            packet_data = data.get('packet_data', b'').encode()
+            # Raw packet body, with addresses and ports in the query string
+            if request.content_type == 'application/octet-stream':
+                packet_data = await self._read_body(request)
+                data = request.query
+                src_port = int(data.get('src_port', 0))
+                dst_port = int(data.get('dst_port', 0))
+            else:
+                # JSON body carrying the packet base64 encoded in packet_data
+                data = await self._read_json_fields(
+                    request, ('packet_data', 'src_ip', 'dst_ip', 'src_port', 'dst_port')
+                )
+                packet_data = base64.b64decode(data.get('packet_data', ''))
+                src_port = data.get('src_port', 0)
+                dst_port = data.get('dst_port', 0)
             src_ip = data.get('src_ip', '0.0.0.0')
             dst_ip = data.get('dst_ip', '0.0.0.0')
-            src_port = data.get('src_port', 0)
-            dst_port = data.get('dst_port', 0)
             
             result = self.threat_detector.analyze_packet(
                 packet_data, src_ip, dst_ip, src_port, dst_port
             )
             
-            return web.json_response(result)
+            return orjson_response(result)
+        except web.HTTPException:
+            raise
         except Exception as e:
-            return web.json_response({'error': str(e)}, status=400)
+            return orjson_response({'error': str(e)}, status=400)
     
     async def block_ip(self, request: web_request.Request) -> web.Response:
         """Block IP address"""
         try:
-            data = await request.json()
+            data = await self._read_json_fields(request, ('ip', 'duration', 'reason'))
             ip = data.get('ip')
             duration = data.get('duration', 3600)
             reason = data.get('reason', 'Manual block')
             
             if not ip:
-                return web.json_response({'error': 'IP address required'}, status=400)
+                return orjson_response({'error': 'IP address required'}, status=400)
             
             success = self.threat_detector.block_ip(ip, duration)
             
             if success:
-                # Create alert
-                await self.alert_system.create_alert(
+                self._response_cache.clear()
+                # Create alert without holding up the response
+                self._queue_alert(
                     AlertType.IP_BLOCKED,
                     AlertSeverity.HIGH,
                     f"IP {ip} Blocked",
@@ -186,45 +595,66 @@ class SecurityAPI:
                     metadata={'duration': duration, 'reason': reason}
                 )
                 
-                return web.json_response({
+                return orjson_response({
                     'success': True,
                     'message': f'IP {ip} blocked successfully',
                     'duration': duration
                 })
             else:
-                return web.json_response({'error': 'Failed to block IP'}, status=400)
+                return orjson_response({'error': 'Failed to block IP'}, status=400)
                 
+        except web.HTTPException:
+            raise
         except Exception as e:
-            return web.json_response({'error': str(e)}, status=400)
+            return orjson_response({'error': str(e)}, status=400)
     
     async def unblock_ip(self, request: web_request.Request) -> web.Response:
         """Unblock IP address"""
         ip = request.match_info['ip']
-        
-        if ip in self.threat_detector.malicious_ips:
-            self.threat_detector.malicious_ips.remove(ip)
-            return web.json_response({
-                'success': True,
-                'message': f'IP {ip} unblocked successfully'
-            })
-        else:
-            return web.json_response({'error': 'IP not found in blocked list'}, status=404)
+
+        if not self.threat_detector.unblock_ip(ip):
+            return orjson_response({'error': 'IP not found in blocked list'}, status=404)
+        self._response_cache.clear()
+
+        return orjson_response({
+            'success': True,
+            'message': f'IP {ip} unblocked successfully'
+        })
     
     # Alert endpoints
     async def get_alerts(self, request: web_request.Request) -> web.Response:
-        """Get all alerts"""
-        alerts = [alert.to_dict() for alert in self.alert_system.alert_history]
-        return web.json_response(alerts)
+        """Get all alerts, or a slice of them with offset/limit"""
+        history = self.alert_system.alert_history_dicts
+        if 'offset' in request.query or 'limit' in request.query:
+            try:
+                offset = max(int(request.query.get('offset', 0)), 0)
+                limit = int(request.query.get('limit', len(history)))
+            except ValueError:
+                return orjson_response({'error': 'offset and limit must be integers'}, status=400)
+            return orjson_response(history[offset:offset + max(limit, 0)])
+        
+        version = self.alert_system.history_version
+        if self._alert_history is None or self._alert_history_version != version:
+            self._alert_history = preserialize(history, ALERT_HISTORY_GZIP_LEVEL)
+            self._alert_history_version = version
+        return preserialized_response(request, self._alert_history)
+    
+    async def _build_active_alerts(self) -> List[Dict[str, Any]]:
+        """Build the active alert list shared by alert and dashboard endpoints"""
+        return self.alert_system.get_active_alert_dicts()
     
     async def get_active_alerts(self, request: web_request.Request) -> web.Response:
         """Get active alerts"""
-        alerts = [alert.to_dict() for alert in self.alert_system.get_active_alerts()]
-        return web.json_response(alerts)
+        return orjson_response(await self._build_active_alerts())
     
+    async def _build_alert_summary(self) -> Dict[str, Any]:
+        """Build the alert statistics shared by alert and dashboard endpoints"""
+        return self.alert_system.get_alert_statistics()
+    
+    @ttl_cached
     async def get_alert_stats(self, request: web_request.Request) -> web.Response:
         """Get alert statistics"""
-        stats = self.alert_system.get_alert_statistics()
-        return web.json_response(stats)
+        return orjson_response(await self._build_alert_summary())
     
     async def acknowledge_alert(self, request: web_request.Request) -> web.Response:
         """Acknowledge alert"""
@@ -232,9 +662,10 @@ class SecurityAPI:
         success = self.alert_system.acknowledge_alert(alert_id)
         
         if success:
-            return web.json_response({'success': True, 'message': 'Alert acknowledged'})
+            self._response_cache.clear()
+            return orjson_response({'success': True, 'message': 'Alert acknowledged'})
         else:
-            return web.json_response({'error': 'Alert not found'}, status=404)
+            return orjson_response({'error': 'Alert not found'}, status=404)
     
     async def resolve_alert(self, request: web_request.Request) -> web.Response:
         """Resolve alert"""
@@ -242,16 +673,21 @@ class SecurityAPI:
         success = self.alert_system.resolve_alert(alert_id)
         
         if success:
-            return web.json_response({'success': True, 'message': 'Alert resolved'})
+            self._response_cache.clear()
+            return orjson_response({'success': True, 'message': 'Alert resolved'})
         else:
-            return web.json_response({'error': 'Alert not found'}, status=404)
+            return orjson_response({'error': 'Alert not found'}, status=404)
     
     async def create_alert(self, request: web_request.Request) -> web.Response:
         """Create new alert"""
         try:
-            data = await request.json()
-            alert_type = AlertType(data.get('type', 'threat_detected'))
-            severity = AlertSeverity(data.get('severity', 'medium'))
+            data = await self._read_json(request)
+            alert_type = ALERT_TYPES.get(data.get('type', 'threat_detected'))
+            if alert_type is None:
+                return orjson_response({'error': f"Unknown alert type: {data['type']}"}, status=400)
+            severity = ALERT_SEVERITIES.get(data.get('severity', 'medium'))
+            if severity is None:
+                return orjson_response({'error': f"Unknown alert severity: {data['severity']}"}, status=400)
             title = data.get('title', '')
             description = data.get('description', '')
             source_ip = data.get('source_ip')
@@ -262,124 +698,94 @@ class SecurityAPI:
                 alert_type, severity, title, description,
                 source_ip, target_ip, metadata
             )
+            self._response_cache.clear()
             
-            return web.json_response(alert.to_dict())
+            return orjson_response(alert.to_dict())
+        except web.HTTPException:
+            raise
         except Exception as e:
-            return web.json_response({'error': str(e)}, status=400)
+            return orjson_response({'error': str(e)}, status=400)
     
     # Network monitoring endpoints
+    async def _build_connections(self) -> List[Dict[str, Any]]:
+        """Build the connection list embedded in dashboard and report payloads"""
+        # This would integrate with your actual connection monitoring
+        return build_mock_connections(self._now())
+    
     async def get_connections(self, request: web_request.Request) -> web.Response:
         """Get network connections"""
         # This would integrate with your actual connection monitoring
-        connections = [
-            {
-                'id': f'conn_{i}',
-                'src_ip': f'192.168.1.{i}',
-                'dst_ip': '8.8.8.8',
-                'src_port': 80 + i,
-                'dst_port': 80,
-                'protocol': 'TCP',
-                'status': 'ESTABLISHED',
-                'bytes_sent': 1024 * i,
-                'bytes_received': 2048 * i,
-                'timestamp': datetime.now().isoformat()
-            }
-            for i in range(1, 11)
-        ]
-        return web.json_response(connections)
+        return cached_json_response(self._connections_template.replace(
+            TIMESTAMP_PLACEHOLDER, self._now_bytes()
+        ))
     
+    @ttl_cached
     async def get_connection_stats(self, request: web_request.Request) -> web.Response:
         """Get connection statistics"""
-        return web.json_response({
+        return orjson_response({
             'total_connections': 28,
             'active_connections': 15,
             'blocked_connections': 3,
             'bytes_transferred': 1024000,
             'packets_sent': 50000,
             'packets_received': 45000,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._now()
         })
     
     async def get_network_topology(self, request: web_request.Request) -> web.Response:
         """Get network topology"""
-        return web.json_response({
-            'nodes': [
-                {'id': 'firewall', 'type': 'firewall', 'status': 'active'},
-                {'id': 'router', 'type': 'router', 'status': 'active'},
-                {'id': 'server1', 'type': 'server', 'status': 'active'},
-                {'id': 'server2', 'type': 'server', 'status': 'active'},
-                {'id': 'client1', 'type': 'client', 'status': 'active'}
-            ],
-            'links': [
-                {'source': 'firewall', 'target': 'router', 'status': 'up'},
-                {'source': 'router', 'target': 'server1', 'status': 'up'},
-                {'source': 'router', 'target': 'server2', 'status': 'up'},
-                {'source': 'router', 'target': 'client1', 'status': 'up'}
-            ]
-        })
+        return preserialized_response(request, self._topology)
     
     # Dashboard endpoints
     async def get_dashboard_overview(self, request: web_request.Request) -> web.Response:
         """Get dashboard overview data"""
-        return web.json_response({
+        # Producers are in-memory today; gather lets slower async ones overlap later
+        threat_summary, alert_summary = await asyncio.gather(
+            self._build_threats(), self._build_alert_summary()
+        )
+        return orjson_response({
             'system_metrics': {
                 'cpu': 45.2,
                 'memory': 67.8,
                 'disk': 23.1,
                 'network': 12.5
             },
-            'threat_summary': self.threat_detector.get_threat_summary(),
-            'alert_summary': self.alert_system.get_alert_statistics(),
+            'threat_summary': threat_summary,
+            'alert_summary': alert_summary,
             'connection_stats': {
                 'total': 28,
                 'active': 15,
                 'blocked': 3
             },
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._now()
         })
     
     async def get_realtime_data(self, request: web_request.Request) -> web.Response:
         """Get real-time data for dashboard"""
-        return web.json_response({
-            'connections': await self.get_connections(request),
-            'threats': await self.get_threats(request),
-            'alerts': await self.get_active_alerts(request),
-            'timestamp': datetime.now().isoformat()
+        connections, threats, alerts = await asyncio.gather(
+            self._build_connections(), self._build_threats(), self._build_active_alerts()
+        )
+        return orjson_response({
+            'connections': connections,
+            'threats': threats,
+            'alerts': alerts,
+            'timestamp': self._now()
         })
     
     async def get_analytics_data(self, request: web_request.Request) -> web.Response:
         """Get analytics data"""
-        return web.json_response({
-            'threat_trends': [
-                {'time': '00:00', 'threats': 5},
-                {'time': '04:00', 'threats': 3},
-                {'time': '08:00', 'threats': 12},
-                {'time': '12:00', 'threats': 8},
-                {'time': '16:00', 'threats': 15},
-                {'time': '20:00', 'threats': 7}
-            ],
-            'top_threat_ips': [
-                {'ip': '192.168.1.100', 'count': 45, 'severity': 'critical'},
-                {'ip': '10.0.0.50', 'count': 32, 'severity': 'high'},
-                {'ip': '172.16.0.25', 'count': 28, 'severity': 'medium'}
-            ],
-            'geographic_data': [
-                {'country': 'United States', 'threats': 45, 'connections': 120},
-                {'country': 'China', 'threats': 32, 'connections': 85},
-                {'country': 'Russia', 'threats': 28, 'connections': 65}
-            ]
-        })
+        return preserialized_response(request, self._analytics)
     
     # Placeholder endpoints for future implementation
     async def get_threat_report(self, request: web_request.Request) -> web.Response:
         """Get threat report"""
-        return web.json_response(self.threat_detector.generate_threat_report())
+        return orjson_response(self.threat_detector.generate_threat_report())
     
     async def get_security_report(self, request: web_request.Request) -> web.Response:
         """Get security report"""
-        return web.json_response({
+        return orjson_response({
             'report_id': f'report_{int(time.time())}',
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': self._now(),
             'threat_summary': self.threat_detector.get_threat_summary(),
             'alert_summary': self.alert_system.get_alert_statistics(),
             'recommendations': [
@@ -389,62 +795,102 @@ class SecurityAPI:
             ]
         })
     
-    async def export_report(self, request: web_request.Request) -> web.Response:
+    async def export_report(self, request: web_request.Request) -> web.StreamResponse:
         """Export report in specified format"""
         format_type = request.match_info['format']
         
+        if format_type == 'csv':
+            return await self._stream_csv_report(request)
+        elif format_type == 'ndjson':
+            return await self._stream_ndjson_report(request)
+        elif format_type != 'json':
+            return orjson_response({'error': 'Unsupported format'}, status=400)
+        
         try:
             # Generate report data
             report_data = {
                 'threats': self.threat_detector.get_threat_summary(),
-                'alerts': [alert.to_dict() for alert in self.alert_system.alert_history],
-                'connections': await self.get_connections(request),
-                'generated_at': datetime.now().isoformat(),
+                'alerts': self.alert_system.alert_history_dicts,
+                'connections': await self._build_connections(),
+                'generated_at': self._now(),
                 'report_id': f'report_{int(time.time())}'
             }
-            
-            if format_type == 'json':
-                return web.json_response(report_data)
-            elif format_type == 'csv':
-                # Convert to CSV format
-                import csv
-                import io
-                
-                output = io.StringIO()
-                writer = csv.writer(output)
-                
-                # Write threats
-                writer.writerow(['Type', 'Threats'])
-                threats = report_data['threats']
-                for key, value in threats.items():
-                    writer.writerow([key, value])
-                
-                writer.writerow([])  # Empty row
-                
-                # Write alerts
-                writer.writerow(['Alert ID', 'Type', 'Severity', 'Title', 'Created At'])
-                for alert in report_data['alerts']:
-                    writer.writerow([
-                        alert.get('id', ''),
-                        alert.get('type', ''),
-                        alert.get('severity', ''),
-                        alert.get('title', ''),
-                        alert.get('created_at', '')
-                    ])
-                
-                csv_content = output.getvalue()
-                output.close()
-                
-                return web.Response(
-                    text=csv_content,
-                    content_type='text/csv',
-                    headers={'Content-Disposition': 'attachment; filename="security_report.csv"'}
-                )
-            else:
-                return web.json_response({'error': 'Unsupported format'}, status=400)
-                
+            return orjson_response(report_data)
         except Exception as e:
-            return web.json_response({'error': f'Export failed: {str(e)}'}, status=500)
+            return orjson_response({'error': f'Export failed: {str(e)}'}, status=500)
+    
+    async def _stream_csv_report(self, request: web_request.Request) -> web.StreamResponse:
+        """Stream the report as CSV, flushing every EXPORT_CHUNK_ROWS rows"""
+        # Snapshot so alerts created while streaming don't disturb iteration
+        alerts = list(self.alert_system.alert_history)
+        threats = self.threat_detector.get_threat_summary()
+        
+        response = web.StreamResponse(headers={
+            'Content-Disposition': 'attachment; filename="security_report.csv"'
+        })
+        response.content_type = 'text/csv'
+        await response.prepare(request)
+        
+        output = io.StringIO()
+        writer = csv.writer(output)
+        
+        async def flush():
+            await response.write(output.getvalue().encode())
+            output.seek(0)
+            output.truncate()
+        
+        # Write threats
+        writer.writerow(['Type', 'Threats'])
+        for key, value in threats.items():
+            writer.writerow([key, value])
+        
+        writer.writerow([])  # Empty row
+        
+        # Write alerts
+        writer.writerow(['Alert ID', 'Type', 'Severity', 'Title', 'Created At'])
+        for i, alert in enumerate(alerts, 1):
+            writer.writerow([
+                alert.id,
+                alert.type.value,
+                alert.severity.value,
+                alert.title,
+                alert.timestamp.isoformat()
+            ])
+            if i % EXPORT_CHUNK_ROWS == 0:
+                await flush()
+        
+        await flush()
+        await response.write_eof()
+        return response
+    
+    async def _stream_ndjson_report(self, request: web_request.Request) -> web.StreamResponse:
+        """Stream the report as one JSON record per line"""
+        alerts = list(self.alert_system.alert_history_dicts)
+        
+        response = web.StreamResponse()
+        response.content_type = 'application/x-ndjson'
+        await response.prepare(request)
+        
+        await response.write(orjson.dumps({
+            'record_type': 'report',
+            'report_id': f'report_{int(time.time())}',
+            'generated_at': self._now(),
+            'threats': self.threat_detector.get_threat_summary()
+        }) + b'\n')
+        
+        chunk = []
+        for alert in alerts:
+            chunk.append(orjson.dumps({'record_type': 'alert', **alert}))
+            if len(chunk) == EXPORT_CHUNK_ROWS:
+                await response.write(b'\n'.join(chunk) + b'\n')
+                chunk.clear()
+        for connection in await self._build_connections():
+            chunk.append(orjson.dumps({'record_type': 'connection', **connection}))
+        if chunk:
+            await response.write(b'\n'.join(chunk) + b'\n')
+        
+        await response.write_eof()
+        return response
 
     # Authentication telemetry helpers/endpoints
     def _get_client_ip(self, request: web_request.Request) -> str:
@@ -466,7 +912,9 @@ class SecurityAPI:
     async def record_login_attempt(self, request: web_request.Request) -> web.Response:
         """Record a login attempt with client IP and user agent"""
         try:
-            data = await request.json()
+            data = await self._read_json(request)
+        except web.HTTPException:
+            raise
         except Exception:
             data = {}
 
@@ -490,13 +938,8 @@ class SecurityAPI:
 
         # Persist append-only JSONL
         try:
-            import os
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            log_dir = os.path.join(base_dir, 'data', 'reports')
-            os.makedirs(log_dir, exist_ok=True)
-            log_file = os.path.join(log_dir, 'login_attempts.jsonl')
-            with open(log_file, 'a') as f:
-                f.write(json.dumps(record) + '\n')
+            with open(self.login_log_file, 'ab') as f:
+                f.write(orjson.dumps(record) + b'\n')
         except Exception:
             # Non-fatal; continue even if persistence fails
             pass
@@ -506,19 +949,18 @@ class SecurityAPI:
         window = now - timedelta(minutes=10)
         recent_failed = sum(1 for a in self.login_attempts if not a.get('success') and datetime.fromisoformat(a['timestamp']) >= window)
 
-        return web.json_response({'ok': True, 'risk': 'elevated' if recent_failed > 10 else 'normal'})
+        return orjson_response({'ok': True, 'risk': 'elevated' if recent_failed > 10 else 'normal'})
 
     async def get_login_stats(self, request: web_request.Request) -> web.Response:
         """Return aggregated login attempt stats for trend charts"""
-        # Build per-minute buckets over last 60 minutes
+        # Refill the reusable per-minute buckets over last 60 minutes
         now = datetime.utcnow().replace(second=0, microsecond=0)
-        buckets: List[Dict[str, Any]] = []
-        for i in range(59, -1, -1):
-            t = now - timedelta(minutes=i)
-            buckets.append({'time': t.isoformat(), 'success': 0, 'failed': 0})
+        buckets = self._login_buckets
+        for i, bucket in enumerate(buckets):
+            bucket['time'] = (now - timedelta(minutes=59 - i)).isoformat()
+            bucket['success'] = 0
+            bucket['failed'] = 0
 
-        # Index buckets by time string for quick updates
-        index = {b['time']: b for b in buckets}
         window_start = now - timedelta(minutes=60)
 
         for a in self.login_attempts:
@@ -528,12 +970,13 @@ class SecurityAPI:
                 continue
             if ts < window_start:
                 break  # attempts are stored newest-first
-            key = ts.isoformat()
-            if key in index:
+            # Bucket position follows directly from the minute offset
+            slot = 59 - int((now - ts).total_seconds()) // 60
+            if 0 <= slot < 60:
                 if a.get('success'):
-                    index[key]['success'] += 1
+                    buckets[slot]['success'] += 1
                 else:
-                    index[key]['failed'] += 1
+                    buckets[slot]['failed'] += 1
 
         total = {
             'total': len(self.login_attempts),
@@ -545,78 +988,56 @@ class SecurityAPI:
         last_5_failed = sum(b['failed'] for b in buckets[-5:])
         risk = 'critical' if last_5_failed > 25 else 'elevated' if last_5_failed > 10 else 'normal'
 
-        return web.json_response({'buckets': buckets, 'totals': total, 'risk': risk})
+        return orjson_response({'buckets': buckets, 'totals': total, 'risk': risk})
     
     # Configuration endpoints
     async def get_config(self, request: web_request.Request) -> web.Response:
         """Get system configuration"""
-        return web.json_response({
-            'threat_detection': {
-                'enabled': True,
-                'sensitivity': 'medium',
-                'auto_block': True
-            },
-            'alerting': {
-                'email_enabled': False,
-                'webhook_enabled': False,
-                'thresholds': {
-                    'critical': 1,
-                    'high': 5,
-                    'medium': 10
-                }
-            },
-            'monitoring': {
-                'scan_interval': 2,
-                'retention_days': 30,
-                'log_level': 'info'
-            }
-        })
+        return preserialized_response(request, self._config)
     
     async def update_config(self, request: web_request.Request) -> web.Response:
         """Update system configuration"""
         try:
-            data = await request.json()
+            data = await self._read_json(request)
             # This would update actual configuration
-            return web.json_response({'success': True, 'message': 'Configuration updated'})
+            return orjson_response({'success': True, 'message': 'Configuration updated'})
+        except web.HTTPException:
+            raise
         except Exception as e:
-            return web.json_response({'error': str(e)}, status=400)
+            return orjson_response({'error': str(e)}, status=400)
     
     async def get_threat_rules(self, request: web_request.Request) -> web.Response:
         """Get threat detection rules"""
-        return web.json_response(self.threat_detector.threat_patterns)
+        return orjson_response(self.threat_detector.threat_patterns)
     
     async def update_threat_rules(self, request: web_request.Request) -> web.Response:
         """Update threat detection rules"""
         try:
-            data = await request.json()
+            data = await self._read_json(request)
             # This would update actual threat rules
-            return web.json_response({'success': True, 'message': 'Threat rules updated'})
+            return orjson_response({'success': True, 'message': 'Threat rules updated'})
+        except web.HTTPException:
+            raise
         except Exception as e:
-            return web.json_response({'error': str(e)}, status=400)
+            return orjson_response({'error': str(e)}, status=400)
     
     # User management endpoints
     async def get_users(self, request: web_request.Request) -> web.Response:
         """Get all users"""
         # In a real implementation, this would query a database
-        users = [
-            {'id': 1, 'username': 'phoenix_7x', 'role': 'admin', 'active': True, 'email': 'phoenix@bigyellowjacket.com'},
-            {'id': 2, 'username': 'storm_delta', 'role': 'user', 'active': True, 'email': 'storm@bigyellowjacket.com'},
-            {'id': 3, 'username': 'cyber_wolf', 'role': 'user', 'active': True, 'email': 'wolf@bigyellowjacket.com'},
-            {'id': 4, 'username': 'shadow_ops', 'role': 'user', 'active': False, 'email': 'shadow@bigyellowjacket.com'}
-        ]
-        return web.json_response(users)
+        return preserialized_response(request, self._users)
     
     async def create_user(self, request: web_request.Request) -> web.Response:
         """Create new user"""
         try:
-            data = await request.json()
+            data = await self._read_json(request)
             username = data.get('username')
             password = data.get('password')
             role = data.get('role', 'user')
             email = data.get('email', '')
             
             if not username or not password:
-                return web.json_response({'error': 'Username and password are required'}, status=400)
+                return orjson_response({'error': 'Username and password are required'}, status=400)
             
             # In a real implementation, this would:
             # 1. Hash the password
@@ -633,37 +1054,33 @@ class SecurityAPI:
                 'created_at': datetime.now().isoformat()
             }
             
-            return web.json_response({
+            return orjson_response({
                 'success': True,
                 'message': 'User created successfully',
                 'user': new_user
             })
             
+        except web.HTTPException:
+            raise
         except Exception as e:
-            return web.json_response({'error': f'Failed to create user: {str(e)}'}, status=400)
+            return orjson_response({'error': f'Failed to create user: {str(e)}'}, status=400)
     
     async def get_user(self, request: web_request.Request) -> web.Response:
         """Get user by ID"""
         user_id = request.match_info['user_id']
         
         # In a real implementation, this would query the database
-        users = {
-            '1': {'id': 1, 'username': 'phoenix_7x', 'role': 'admin', 'active': True, 'email': 'phoenix@bigyellowjacket.com'},
-            '2': {'id': 2, 'username': 'storm_delta', 'role': 'user', 'active': True, 'email': 'storm@bigyellowjacket.com'},
-            '3': {'id': 3, 'username': 'cyber_wolf', 'role': 'user', 'active': True, 'email': 'wolf@bigyellowjacket.com'},
-            '4': {'id': 4, 'username': 'shadow_ops', 'role': 'user', 'active': False, 'email': 'shadow@bigyellowjacket.com'}
-        }
-        
-        if user_id in users:
-            return web.json_response(users[user_id])
+        payload = self._user_payloads.get(user_id)
+        if payload is not None:
+            return preserialized_response(request, payload)
         else:
-            return web.json_response({'error': 'User not found'}, status=404)
+            return orjson_response({'error': 'User not found'}, status=404)
     
     async def update_user(self, request: web_request.Request) -> web.Response:
         """Update user"""
         try:
             user_id = request.match_info['user_id']
-            data = await request.json()
+            data = await self._read_json(request)
             
             # In a real implementation, this would:
             # 1. Validate the user exists
@@ -671,14 +1088,16 @@ class SecurityAPI:
             # 3. Log the changes
             
             # For now, just return success
-            return web.json_response({
+            return orjson_response({
                 'success': True,
                 'message': f'User {user_id} updated successfully',
                 'updated_fields': list(data.keys())
             })
             
+        except web.HTTPException:
+            raise
         except Exception as e:
-            return web.json_response({'error': f'Failed to update user: {str(e)}'}, status=400)
+            return orjson_response({'error': f'Failed to update user: {str(e)}'}, status=400)
     
     async def delete_user(self, request: web_request.Request) -> web.Response:
         """Delete user"""
@@ -692,13 +1111,13 @@ class SecurityAPI:
             # 4. Log the deletion
             
             # For now, just return success
-            return web.json_response({
+            return orjson_response({
                 'success': True,
                 'message': f'User {user_id} deleted successfully'
             })
             
         except Exception as e:
-            return web.json_response({'error': f'Failed to delete user: {str(e)}'}, status=400)
+            return orjson_response({'error': f'Failed to delete user: {str(e)}'}, status=400)
 
 # Create API instance
 api = SecurityAPI()
@@ -5,14 +5,88 @@ Handles threat alerts, notifications, and automated responses
 """
 
 import asyncio
-import json
-import time
+import bisect
+import itertools
+import logging
+import queue
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
 from enum import Enum
+import orjson
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.header import Header
+from logging.handlers import QueueHandler, QueueListener
+
+logger = logging.getLogger(__name__)
+
+# Root handlers moved behind the queue by start_alert_logging, restored on stop
+_log_listener: Optional[QueueListener] = None
+_root_handlers: List[logging.Handler] = []
+
+# Broadcasts buffered per subscriber; the oldest is dropped when a slow client falls behind
+SUBSCRIBER_QUEUE_SIZE = 256
+
+# SMTP connections kept open for alert emails
+SMTP_POOL_SIZE = 4
+
+# Plain-text alert email body; headers are prebuilt in configure_email_notifications
+EMAIL_BODY_TEMPLATE = """
+        Critical Security Alert
+        
+        Alert ID: {id}
+        Severity: {severity}
+        Title: {title}
+        Description: {description}
+        Source IP: {source_ip}
+        Target IP: {target_ip}
+        Timestamp: {timestamp}
+        
+        Please investigate immediately.
+        
+        Big Yellow Jacket Security System
+        """
+
+# Alerts kept in history. The history lists and every alert index are trimmed
+# together, in steps of ALERT_HISTORY_TRIM once they pass the limit, so trimming
+# is amortized and all views always cover the same alerts
+ALERT_HISTORY_LIMIT = 100_000
+ALERT_HISTORY_TRIM = 1_000
+
+# Alerts are broadcast as one alert_batch frame per this many alerts ...
+BROADCAST_BATCH_SIZE = 32
+# ... or per this many seconds after the first unsent alert
+BROADCAST_BATCH_WINDOW = 0.010
+
+
+def start_alert_logging():
+    """Move root log handlers onto a listener thread so logging an alert is only a queue put"""
+    global _log_listener, _root_handlers
+    if _log_listener is not None:
+        return
+    root = logging.getLogger()
+    _root_handlers = root.handlers[:]
+    handlers = _root_handlers
+    if not handlers:
+        # No logging configured; print alert lines as the servers always have
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers = [handler]
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    _log_listener.start()
+
+def stop_alert_logging():
+    """Flush queued log records and give the root logger its handlers back"""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    _log_listener = None
+    logging.getLogger().handlers = _root_handlers
 
 class AlertSeverity(Enum):
     LOW = "low"
@@ -31,9 +105,12 @@ class AlertType(Enum):
 class Alert:
     """Represents a security alert"""
     
+    __slots__ = ('id', 'type', 'severity', 'title', 'description', 'source_ip', 'target_ip',
+                 'metadata', 'timestamp', 'acknowledged', 'resolved', 'auto_resolved')
+    
     def __init__(self, alert_id: str, alert_type: AlertType, severity: AlertSeverity,
                  title: str, description: str, source_ip: str = None, 
-                 target_ip: str = None, metadata: Dict = None):
+                 target_ip: str = None, metadata: Dict = None, timestamp: datetime = None):
         self.id = alert_id
         self.type = alert_type
         self.severity = severity
@@ -42,7 +119,7 @@ class Alert:
         self.source_ip = source_ip
         self.target_ip = target_ip
         self.metadata = metadata or {}
-        self.timestamp = datetime.now()
+        self.timestamp = timestamp or datetime.now()
         self.acknowledged = False
         self.resolved = False
         self.auto_resolved = False
@@ -64,16 +141,37 @@ class Alert:
             'auto_resolved': self.auto_resolved
         }
 
+class AlertSubscriber:
+    """WebSocket subscriber with its own outbound queue and writer task"""
+    
+    def __init__(self, websocket, queue: asyncio.Queue, task: asyncio.Task):
+        self.websocket = websocket
+        self.queue = queue
+        self.task = task
+
 class AlertSystem:
     """Real-time alert management system"""
     
     def __init__(self):
         self.alerts = {}  # alert_id -> Alert
-        self.alert_history = []
-        self.subscribers = []  # WebSocket connections
+        self._id_counter = itertools.count(1)  # keeps IDs unique within a millisecond
+        self.alert_history: List[Alert] = []  # oldest first
+        self.alert_history_dicts = []  # to_dict() of each entry in alert_history
+        self._history_ts = []  # timestamp of each entry in alert_history_dicts, for bisect
+        self.alert_dicts = {}  # alert_id -> entry in alert_history_dicts
+        self.history_version = 0  # bumped whenever alert_history_dicts changes
+        self.subscribers: Dict[int, AlertSubscriber] = {}  # id(websocket) -> subscriber
+        self._pending_broadcast: List[Dict[str, Any]] = []
+        self._broadcast_timer: Optional[asyncio.TimerHandle] = None
         self.alert_rules = []
+        # Rules with match_severity/match_type are dispatched by index; the rest are scanned
+        self._rules_by_severity: Dict[AlertSeverity, List[Dict]] = {}
+        self._rules_by_type: Dict[AlertType, List[Dict]] = {}
+        self._general_rules: List[Dict] = []
         self.auto_response_rules = []
         self.email_config = None
+        self._smtp_pool: Optional[asyncio.Queue] = None
+        self._email_headers = ""
         self.slack_config = None
         
         # Alert statistics
@@ -83,6 +181,13 @@ class AlertSystem:
             'resolved_alerts': 0,
             'active_alerts': 0
         }
+        # Unresolved alerts per severity, kept current by create/resolve
+        self._active_by_severity: Counter = Counter()
+        # Secondary indexes over self.alerts; dicts are used as insertion-ordered id sets
+        self._by_severity: Dict[AlertSeverity, Dict[str, None]] = {
+            severity: {} for severity in AlertSeverity
+        }
+        self._active_ids: Dict[str, None] = {}
         
         # Initialize default rules
         self._setup_default_rules()
@@ -92,50 +197,77 @@ class AlertSystem:
         # Critical threat rule
         self.add_alert_rule(
             name="Critical Threat Detection",
-            condition=lambda alert: alert.severity == AlertSeverity.CRITICAL,
+            match_severity=AlertSeverity.CRITICAL,
             action=self._handle_critical_alert
         )
         
         # IP blocking rule
         self.add_alert_rule(
             name="IP Blocking Alert",
-            condition=lambda alert: alert.type == AlertType.IP_BLOCKED,
+            match_type=AlertType.IP_BLOCKED,
             action=self._handle_ip_blocking_alert
         )
         
         # High severity rule
         self.add_alert_rule(
             name="High Severity Alert",
-            condition=lambda alert: alert.severity == AlertSeverity.HIGH,
+            match_severity=AlertSeverity.HIGH,
             action=self._handle_high_severity_alert
         )
     
     def add_subscriber(self, websocket):
         """Add WebSocket subscriber for real-time alerts"""
-        self.subscribers.append(websocket)
+        if id(websocket) in self.subscribers:
+            return
+        outbox = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        task = asyncio.create_task(self._subscriber_writer(websocket, outbox))
+        self.subscribers[id(websocket)] = AlertSubscriber(websocket, outbox, task)
     
     def remove_subscriber(self, websocket):
         """Remove WebSocket subscriber"""
-        if websocket in self.subscribers:
-            self.subscribers.remove(websocket)
+        subscriber = self.subscribers.pop(id(websocket), None)
+        if subscriber is not None and subscriber.task is not asyncio.current_task():
+            subscriber.task.cancel()
+    
+    async def _subscriber_writer(self, websocket, outbox: asyncio.Queue):
+        """Send queued broadcasts to one subscriber until it disconnects"""
+        while True:
+            payload = await outbox.get()
+            try:
+                await websocket.send_str(payload)
+            except Exception:
+                self.remove_subscriber(websocket)
+                return
     
     async def create_alert(self, alert_type: AlertType, severity: AlertSeverity,
                           title: str, description: str, source_ip: str = None,
                           target_ip: str = None, metadata: Dict = None) -> Alert:
         """Create and process a new alert"""
-        alert_id = self._generate_alert_id()
+        now = datetime.now()
+        alert_id = self._generate_alert_id(now)
         alert = Alert(alert_id, alert_type, severity, title, description,
-                     source_ip, target_ip, metadata)
+                     source_ip, target_ip, metadata, timestamp=now)
         
         # Store alert
         self.alerts[alert_id] = alert
         self.alert_history.append(alert)
+        alert_dict = alert.to_dict()
+        self.alert_history_dicts.append(alert_dict)
+        self._history_ts.append(now)
+        self.alert_dicts[alert_id] = alert_dict
+        self.history_version += 1
         
         # Update statistics
         self.stats['total_alerts'] += 1
         if severity == AlertSeverity.CRITICAL:
             self.stats['critical_alerts'] += 1
         self.stats['active_alerts'] += 1
+        self._active_by_severity[severity] += 1
+        self._by_severity[severity][alert_id] = None
+        self._active_ids[alert_id] = None
+        
+        if len(self.alert_history) > ALERT_HISTORY_LIMIT + ALERT_HISTORY_TRIM:
+            self._trim_history()
         
         # Process alert through rules
         await self._process_alert(alert)
@@ -144,57 +276,110 @@ class AlertSystem:
         await self._notify_subscribers(alert)
         
         # Log alert
-        print(f"[ALERT] {severity.value.upper()}: {title} - {alert_id}")
+        logger.info(f"[ALERT] {severity.value.upper()}: {title} - {alert_id}")
         
         return alert
     
-    def _generate_alert_id(self) -> str:
+    def _trim_history(self):
+        """Drop the oldest alerts beyond ALERT_HISTORY_LIMIT from history and every index"""
+        excess = len(self.alert_history) - ALERT_HISTORY_LIMIT
+        for alert in self.alert_history[:excess]:
+            del self.alerts[alert.id]
+            del self.alert_dicts[alert.id]
+            self._by_severity[alert.severity].pop(alert.id, None)
+            if alert.id in self._active_ids:
+                # Evicted while unresolved: it no longer counts as active
+                del self._active_ids[alert.id]
+                self.stats['active_alerts'] -= 1
+                self._active_by_severity[alert.severity] -= 1
+        
+        del self.alert_history[:excess]
+        del self.alert_history_dicts[:excess]
+        del self._history_ts[:excess]
+    
+    def _generate_alert_id(self, now: datetime) -> str:
         """Generate unique alert ID"""
-        timestamp = int(time.time() * 1000)
-        return f"ALERT_{timestamp}"
+        timestamp = int(now.timestamp() * 1000)
+        return f"ALERT_{timestamp}_{next(self._id_counter)}"
     
     async def _process_alert(self, alert: Alert):
-        """Process alert through all rules"""
-        for rule in self.alert_rules:
-            try:
-                if rule['condition'](alert):
-                    await rule['action'](alert)
-            except Exception as e:
-                print(f"[ERROR] Alert rule processing failed: {e}")
+        """Process alert through the rules that can match it"""
+        if not (self._rules_by_severity or self._rules_by_type or self._general_rules):
+            return
+        
+        for rules in (self._rules_by_severity.get(alert.severity, ()),
+                      self._rules_by_type.get(alert.type, ()),
+                      self._general_rules):
+            for rule in rules:
+                try:
+                    if rule['match_type'] is not None and rule['match_type'] != alert.type:
+                        continue
+                    if rule['condition'] is None or rule['condition'](alert):
+                        await rule['action'](alert)
+                except Exception as e:
+                    logger.error(f"[ERROR] Alert rule processing failed: {e}")
     
     async def _notify_subscribers(self, alert: Alert):
-        """Notify all WebSocket subscribers about new alert"""
+        """Queue alert for the next batched broadcast to WebSocket subscribers"""
         if not self.subscribers:
             return
         
-        alert_data = {
-            'message_type': 'alert',
-            'data': alert.to_dict()
-        }
+        # Reuse the dict built when the alert was stored
+        self._pending_broadcast.append(self.alert_dicts.get(alert.id) or alert.to_dict())
+        if len(self._pending_broadcast) >= BROADCAST_BATCH_SIZE:
+            self._flush_broadcast()
+        elif self._broadcast_timer is None:
+            self._broadcast_timer = asyncio.get_running_loop().call_later(
+                BROADCAST_BATCH_WINDOW, self._flush_broadcast
+            )
+    
+    def _flush_broadcast(self):
+        """Send pending alerts to all subscribers as a single alert_batch frame"""
+        if self._broadcast_timer is not None:
+            self._broadcast_timer.cancel()
+            self._broadcast_timer = None
         
-        # Send to all subscribers
-        disconnected = []
-        for ws in self.subscribers:
-            try:
-                await ws.send_str(json.dumps(alert_data))
-            except Exception:
-                disconnected.append(ws)
+        batch, self._pending_broadcast = self._pending_broadcast, []
+        if not batch or not self.subscribers:
+            return
         
-        # Remove disconnected subscribers
-        for ws in disconnected:
-            self.remove_subscriber(ws)
+        # Dashboards parse text frames, so the orjson bytes are decoded once for send_str
+        payload = orjson.dumps({
+            'message_type': 'alert_batch',
+            'data': batch
+        }).decode()
+        
+        # Hand off to each subscriber's writer; never wait on a slow client
+        for subscriber in tuple(self.subscribers.values()):
+            try:
+                subscriber.queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                subscriber.queue.get_nowait()
+                subscriber.queue.put_nowait(payload)
     
-    def add_alert_rule(self, name: str, condition: Callable, action: Callable):
+    def add_alert_rule(self, name: str, condition: Optional[Callable] = None,
+                       action: Callable = None, match_severity: Optional[AlertSeverity] = None,
+                       match_type: Optional[AlertType] = None):
         """Add custom alert processing rule"""
-        self.alert_rules.append({
+        rule = {
             'name': name,
             'condition': condition,
-            'action': action
-        })
+            'action': action,
+            'match_severity': match_severity,
+            'match_type': match_type
+        }
+        self.alert_rules.append(rule)
+        
+        if match_severity is not None:
+            self._rules_by_severity.setdefault(match_severity, []).append(rule)
+        elif match_type is not None:
+            self._rules_by_type.setdefault(match_type, []).append(rule)
+        else:
+            self._general_rules.append(rule)
     
     async def _handle_critical_alert(self, alert: Alert):
         """Handle critical alerts with immediate response"""
-        print(f"[CRITICAL] Immediate response required for alert: {alert.id}")
+        logger.critical(f"[CRITICAL] Immediate response required for alert: {alert.id}")
         
         # Auto-block malicious IPs
         if alert.source_ip and alert.type == AlertType.THREAT_DETECTED:
@@ -202,16 +387,16 @@ class AlertSystem:
     
     async def _handle_ip_blocking_alert(self, alert: Alert):
         """Handle IP blocking alerts"""
-        print(f"[BLOCK] IP {alert.source_ip} has been blocked")
+        logger.info(f"[BLOCK] IP {alert.source_ip} has been blocked")
     
     async def _handle_high_severity_alert(self, alert: Alert):
         """Handle high severity alerts"""
-        print(f"[HIGH] High severity alert requires attention: {alert.title}")
+        logger.warning(f"[HIGH] High severity alert requires attention: {alert.title}")
     
     async def _auto_block_ip(self, ip: str, reason: str):
         """Automatically block malicious IP"""
         # This would integrate with your firewall/blocking system
-        print(f"[AUTO-BLOCK] Blocking IP {ip}: {reason}")
+        logger.warning(f"[AUTO-BLOCK] Blocking IP {ip}: {reason}")
         
         # Create blocking alert
         await self.create_alert(
@@ -227,7 +412,9 @@ class AlertSystem:
         """Acknowledge an alert"""
         if alert_id in self.alerts:
             self.alerts[alert_id].acknowledged = True
-            print(f"[ALERT] Alert {alert_id} acknowledged by {user}")
+            self.alert_dicts[alert_id]['acknowledged'] = True
+            self.history_version += 1
+            logger.info(f"[ALERT] Alert {alert_id} acknowledged by {user}")
             return True
         return False
     
@@ -235,30 +422,36 @@ class AlertSystem:
         """Resolve an alert"""
         if alert_id in self.alerts:
             alert = self.alerts[alert_id]
+            if not alert.resolved:
+                self.stats['resolved_alerts'] += 1
+                self.stats['active_alerts'] -= 1
+                self._active_by_severity[alert.severity] -= 1
+                self._active_ids.pop(alert_id, None)
             alert.resolved = True
-            self.stats['resolved_alerts'] += 1
-            self.stats['active_alerts'] -= 1
-            print(f"[ALERT] Alert {alert_id} resolved by {user}")
+            self.alert_dicts[alert_id]['resolved'] = True
+            self.history_version += 1
+            logger.info(f"[ALERT] Alert {alert_id} resolved by {user}")
             return True
         return False
     
     def get_active_alerts(self) -> List[Alert]:
         """Get all active (unresolved) alerts"""
-        return [alert for alert in self.alerts.values() if not alert.resolved]
+        return [self.alerts[alert_id] for alert_id in self._active_ids]
+    
+    def get_active_alert_dicts(self) -> List[Dict[str, Any]]:
+        """Get serialized active alerts, oldest first"""
+        return [self.alert_dicts[alert_id] for alert_id in self._active_ids]
     
     def get_alerts_by_severity(self, severity: AlertSeverity) -> List[Alert]:
         """Get alerts by severity level"""
-        return [alert for alert in self.alerts.values() if alert.severity == severity]
+        return [self.alerts[alert_id] for alert_id in self._by_severity[severity]]
     
     def get_alert_statistics(self) -> Dict[str, Any]:
         """Get alert statistics"""
-        active_alerts = self.get_active_alerts()
-        critical_alerts = self.get_alerts_by_severity(AlertSeverity.CRITICAL)
-        
         return {
             'total_alerts': self.stats['total_alerts'],
-            'active_alerts': len(active_alerts),
-            'critical_alerts': len(critical_alerts),
+            'active_alerts': sum(self._active_by_severity.values()),
+            'critical_alerts': self.stats['critical_alerts'],
             'resolved_alerts': self.stats['resolved_alerts'],
             'alert_rate_per_hour': self._calculate_alert_rate(),
             'last_updated': datetime.now().isoformat()
@@ -266,44 +459,30 @@ class AlertSystem:
     
     def _calculate_alert_rate(self) -> float:
         """Calculate alerts per hour"""
-        if not self.alert_history:
+        if not self._history_ts:
             return 0.0
         
         # Count alerts from last hour
         one_hour_ago = datetime.now() - timedelta(hours=1)
-        recent_alerts = [
-            alert for alert in self.alert_history
-            if alert.timestamp > one_hour_ago
-        ]
-        
-        return len(recent_alerts)
+        return len(self._history_ts) - bisect.bisect_right(self._history_ts, one_hour_ago)
     
     def get_alert_dashboard_data(self) -> Dict[str, Any]:
         """Get data for alert dashboard"""
-        active_alerts = self.get_active_alerts()
-        
         # Group by severity
         severity_counts = {
-            'low': 0,
-            'medium': 0,
-            'high': 0,
-            'critical': 0
+            severity.value: self._active_by_severity[severity]
+            for severity in AlertSeverity
         }
         
-        for alert in active_alerts:
-            severity_counts[alert.severity.value] += 1
-        
         # Recent alerts (last 24 hours)
         one_day_ago = datetime.now() - timedelta(days=1)
-        recent_alerts = [
-            alert.to_dict() for alert in self.alert_history
-            if alert.timestamp > one_day_ago
-        ]
+        start = max(bisect.bisect_right(self._history_ts, one_day_ago),
+                    len(self._history_ts) - 10)  # Last 10 alerts
         
         return {
             'severity_counts': severity_counts,
-            'total_active': len(active_alerts),
-            'recent_alerts': recent_alerts[-10:],  # Last 10 alerts
+            'total_active': sum(severity_counts.values()),
+            'recent_alerts': self.alert_history_dicts[start:],
             'statistics': self.get_alert_statistics()
         }
     
@@ -319,38 +498,88 @@ class AlertSystem:
             'from_email': from_email,
             'to_emails': to_emails
         }
+        self._email_headers = (
+            f"From: {from_email}\r\n"
+            f"To: {', '.join(to_emails)}\r\n"
+            "MIME-Version: 1.0\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "Content-Transfer-Encoding: 8bit\r\n"
+        )
+        
+        # Drop connections to a previous server; new ones are opened on first use
+        if self._smtp_pool is not None:
+            while not self._smtp_pool.empty():
+                smtp = self._smtp_pool.get_nowait()
+                if smtp is not None:
+                    smtp.close()
+        self._smtp_pool = asyncio.Queue()
+        for _ in range(SMTP_POOL_SIZE):
+            self._smtp_pool.put_nowait(None)
+    
+    def _open_smtp(self) -> smtplib.SMTP:
+        """Connect and log in to the configured SMTP server"""
+        config = self.email_config
+        if config['smtp_port'] == 465:
+            smtp = smtplib.SMTP_SSL(config['smtp_server'], config['smtp_port'], timeout=10)
+        else:
+            smtp = smtplib.SMTP(config['smtp_server'], config['smtp_port'], timeout=10)
+            smtp.starttls()
+        if config['username']:
+            smtp.login(config['username'], config['password'])
+        return smtp
+    
+    def _send_via_smtp(self, smtp: Optional[smtplib.SMTP], msg: bytes) -> smtplib.SMTP:
+        """Send msg on a pooled connection, reconnecting if it is missing or stale, closing it on failure"""
+        from_email = self.email_config['from_email']
+        to_emails = self.email_config['to_emails']
+        if smtp is None:
+            smtp = self._open_smtp()
+        try:
+            smtp.sendmail(from_email, to_emails, msg)
+        except smtplib.SMTPServerDisconnected:
+            smtp.close()
+            smtp = self._open_smtp()
+            try:
+                smtp.sendmail(from_email, to_emails, msg)
+            except Exception:
+                smtp.close()
+                raise
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
     
     async def send_email_alert(self, alert: Alert):
         """Send email notification for critical alerts"""
         if not self.email_config or alert.severity != AlertSeverity.CRITICAL:
             return
         
+        # Titles come from API clients: keep them on one line and RFC 2047 encode non-ASCII
+        title = " ".join(alert.title.splitlines())
+        subject = f"CRITICAL ALERT: {title}"
+        if not subject.isascii():
+            subject = Header(subject, 'utf-8').encode()
+        body = EMAIL_BODY_TEMPLATE.format(
+            id=alert.id,
+            severity=alert.severity.value.upper(),
+            title=alert.title,
+            description=alert.description,
+            source_ip=alert.source_ip or 'N/A',
+            target_ip=alert.target_ip or 'N/A',
+            timestamp=alert.timestamp
+        )
+        # smtplib only fixes bare LFs for str messages, so normalize to CRLF before encoding
+        body = "\r\n".join(body.splitlines())
+        msg = f"{self._email_headers}Subject: {subject}\r\n\r\n{body}\r\n".encode()
+        
+        # Send on a pooled connection in a worker thread so the event loop never blocks
+        smtp = await self._smtp_pool.get()
         try:
-            msg = MIMEMultipart()
-            msg['From'] = self.email_config['from_email']
-            msg['To'] = ', '.join(self.email_config['to_emails'])
-            msg['Subject'] = f"CRITICAL ALERT: {alert.title}"
-            
-            body = f"""
-            Critical Security Alert
-            
-            Alert ID: {alert.id}
-            Severity: {alert.severity.value.upper()}
-            Title: {alert.title}
-            Description: {alert.description}
-            Source IP: {alert.source_ip or 'N/A'}
-            Target IP: {alert.target_ip or 'N/A'}
-            Timestamp: {alert.timestamp}
-            
-            Please investigate immediately.
-            
-            Big Yellow Jacket Security System
-            """
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Send email (in production, use async email sending)
-            print(f"[EMAIL] Critical alert email sent for {alert.id}")
-            
+            smtp = await asyncio.to_thread(self._send_via_smtp, smtp, msg)
+            logger.info(f"[EMAIL] Critical alert email sent for {alert.id}")
         except Exception as e:
-            print(f"[ERROR] Failed to send email alert: {e}")
+            # _send_via_smtp has closed whatever connection it failed on
+            smtp = None
+            logger.error(f"[ERROR] Failed to send email alert: {e}")
+        finally:
+            self._smtp_pool.put_nowait(smtp)
@@ -5,23 +5,61 @@ Blocks non-encrypted and dangerous ports for enhanced security
 """
 
 import os
-import json
+import orjson
 import logging
 import subprocess
 import platform
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Set
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set
 from ..utils.file_encryption import FileEncryption
 
 class PortBlocker:
     """Advanced port blocking system with encryption support"""
     
+    # Ports that should always be blocked (non-encrypted production ports only)
+    ALWAYS_BLOCK = frozenset({
+        80, 21, 23, 25, 53, 110, 143, 161, 389, 445
+    })
+    
+    # Ports that should always be allowed (encrypted + development)
+    ALWAYS_ALLOW = frozenset({
+        443, 22, 993, 995, 3389, 5900, 587, 465, 636, 989, 990,
+        # Development ports for local development
+        5173,  # Vite dev server
+        8766,  # Our WebSocket server
+        3000,  # Common React dev server (if needed)
+        5000,  # Common dev server (if needed)
+        8080,  # Common dev server (if needed)
+        8000,  # Common dev server (if needed)
+    })
+    
+    # Common unencrypted ports closed by an emergency lockdown, minus anything always allowed
+    EMERGENCY_BLOCK_PORTS = tuple(sorted(frozenset({
+        80, 21, 23, 25, 53, 110, 143, 161, 389, 445,
+        8080, 8000, 3000, 5000, 9000, 9090, 8888
+    }) - ALWAYS_ALLOW))
+    
+    # ipset holding every blocked port on Linux, matched by a single iptables rule per protocol
+    IPSET_NAME = "byj_blocked"
+    
+    # Sorted snapshots for status payloads and rule files
+    ALWAYS_BLOCK_LIST = tuple(sorted(ALWAYS_BLOCK))
+    ALWAYS_ALLOW_LIST = tuple(sorted(ALWAYS_ALLOW))
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.encryption = FileEncryption()
         self.rules_file = "data/port_rules.json.encrypted"
         self.blocked_ports_file = "data/blocked_ports.txt.encrypted"
         
+        # Blocked ports are decrypted once, then kept in step with every save;
+        # writers hold the lock across read-update-save, so it must be re-entrant
+        self._blocked_cache: Optional[List[int]] = None
+        self._blocked_set: Set[int] = set()
+        self._cache_lock = threading.RLock()
+        
         # Define dangerous and non-encrypted ports
         self.dangerous_ports = {
             80: "HTTP (unencrypted)",
@@ -46,23 +84,6 @@ class PortBlocker:
             5000: "Development Server (unencrypted)"
         }
         
-        # Ports that should always be blocked (non-encrypted production ports only)
-        self.always_block = {
-            80, 21, 23, 25, 53, 110, 143, 161, 389, 445
-        }
-        
-        # Ports that should always be allowed (encrypted + development)
-        self.always_allow = {
-            443, 22, 993, 995, 3389, 5900, 587, 465, 636, 989, 990,
-            # Development ports for local development
-            5173,  # Vite dev server
-            8766,  # Our WebSocket server
-            3000,  # Common React dev server (if needed)
-            5000,  # Common dev server (if needed)
-            8080,  # Common dev server (if needed)
-            8000,  # Common dev server (if needed)
-        }
-        
         self.initialize_port_blocker()
     
     def initialize_port_blocker(self):
@@ -85,29 +106,17 @@ class PortBlocker:
         """Create initial port blocking rules"""
         try:
             initial_rules = {
-                "blocked_ports": list(self.always_block),
-                "allowed_ports": list(self.always_allow),
+                "blocked_ports": self.ALWAYS_BLOCK_LIST,
+                "allowed_ports": self.ALWAYS_ALLOW_LIST,
                 "custom_rules": [],
                 "enabled": True,
                 "created_at": datetime.now().isoformat(),
                 "last_updated": datetime.now().isoformat()
             }
             
-            # Save rules to temporary file
-            temp_path = "temp_port_rules.json"
-            with open(temp_path, 'w') as f:
-                json.dump(initial_rules, f, indent=2)
-            
-            # Encrypt the file
-            self.encryption.encrypt_file(temp_path)
-            
-            # Move to final location
-            if os.path.exists(f"{temp_path}.encrypted"):
-                os.rename(f"{temp_path}.encrypted", self.rules_file)
-            
-            # Clean up temp file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            # Encrypt in memory and write straight to the final location
+            data = orjson.dumps(initial_rules, option=orjson.OPT_INDENT_2)
+            Path(self.rules_file).write_bytes(self.encryption.encrypt_bytes(data))
             
             self.logger.info("Initial port rules created and encrypted")
             
@@ -132,16 +141,7 @@ class PortBlocker:
     def _apply_macos_rules(self):
         """Apply port blocking rules on macOS using pfctl"""
         try:
-            # Create pfctl rules file
-            rules_content = self._generate_pfctl_rules()
-            
-            with open("/tmp/byj_port_rules.conf", "w") as f:
-                f.write(rules_content)
-            
-            # Load rules into pfctl
-            subprocess.run([
-                "sudo", "pfctl", "-f", "/tmp/byj_port_rules.conf"
-            ], check=True)
+            self._load_pfctl_rules()
             
             # Enable pfctl if not already enabled
             subprocess.run([
@@ -158,31 +158,22 @@ class PortBlocker:
     def _apply_linux_rules(self):
         """Apply port blocking rules on Linux using iptables"""
         try:
-            # First, allow localhost traffic
+            # Blocked ports live in a bitmap ipset, so later changes never touch iptables
             subprocess.run([
-                "sudo", "iptables", "-A", "INPUT", 
-                "-s", "127.0.0.1", "-j", "ACCEPT"
+                "sudo", "ipset", "create", self.IPSET_NAME,
+                "bitmap:port", "range", "0-65535", "-exist"
             ], check=True)
+            self._ipset_add(self.ALWAYS_BLOCK.union(self.get_blocked_ports()) - self.ALWAYS_ALLOW)
             
-            subprocess.run([
-                "sudo", "iptables", "-A", "INPUT", 
-                "-s", "::1", "-j", "ACCEPT"
-            ], check=True)
+            # Allow localhost traffic first, then drop blocked ports from external sources
+            rules = ["-A INPUT -s 127.0.0.1 -j ACCEPT"]
+            for proto in ("tcp", "udp"):
+                rules.append(
+                    f"-A INPUT -p {proto} -m set --match-set {self.IPSET_NAME} dst "
+                    f"! -s 127.0.0.1 -j DROP"
+                )
             
-            # Then block dangerous ports from external sources
-            for port in self.always_block:
-                # Block incoming connections to dangerous ports (external only)
-                subprocess.run([
-                    "sudo", "iptables", "-A", "INPUT", 
-                    "-p", "tcp", "--dport", str(port), 
-                    "!", "-s", "127.0.0.1", "!", "-s", "::1", "-j", "DROP"
-                ], check=True)
-                
-                subprocess.run([
-                    "sudo", "iptables", "-A", "INPUT", 
-                    "-p", "udp", "--dport", str(port), 
-                    "!", "-s", "127.0.0.1", "!", "-s", "::1", "-j", "DROP"
-                ], check=True)
+            self._iptables_restore(rules)
             
             self.logger.info("Linux port blocking rules applied successfully")
             
@@ -191,78 +182,103 @@ class PortBlocker:
         except Exception as e:
             self.logger.error(f"Error applying Linux rules: {e}")
     
+    def _iptables_restore(self, rules: List[str]):
+        """Append filter rules in a single iptables-restore transaction"""
+        document = "*filter\n" + "\n".join(rules) + "\nCOMMIT\n"
+        subprocess.run([
+            "sudo", "iptables-restore", "--noflush"
+        ], input=document, text=True, check=True)
+    
+    def _ipset_add(self, ports):
+        """Add ports to the blocked ipset in a single ipset-restore call"""
+        commands = "".join(f"add {self.IPSET_NAME} {port}\n" for port in sorted(ports))
+        subprocess.run([
+            "sudo", "ipset", "restore", "-exist"
+        ], input=commands, text=True, check=True)
+    
+    def _load_pfctl_rules(self):
+        """Write the current pfctl ruleset and load it"""
+        with open("/tmp/byj_port_rules.conf", "w") as f:
+            f.write(self._generate_pfctl_rules())
+        
+        subprocess.run([
+            "sudo", "pfctl", "-f", "/tmp/byj_port_rules.conf"
+        ], check=True)
+    
     def _generate_pfctl_rules(self) -> str:
         """Generate pfctl rules for macOS"""
+        # pf tables only hold addresses, so port sets are list macros that pf
+        # expands and optimizes when the ruleset is loaded
+        blocked = sorted(self.ALWAYS_BLOCK.union(self.get_blocked_ports()) - self.ALWAYS_ALLOW)
         rules = [
             "# Big Yellow Jacket Security - Port Blocking Rules",
             "# Generated automatically",
             "",
+            f"byj_blocked = \"{{ {', '.join(map(str, blocked))} }}\"",
+            f"byj_allowed = \"{{ {', '.join(map(str, self.ALWAYS_ALLOW_LIST))} }}\"",
+            "",
             "# Always allow localhost traffic (development)",
-            "pass in proto tcp from 127.0.0.1 to any",
-            "pass in proto udp from 127.0.0.1 to any",
-            "pass in proto tcp from ::1 to any",
-            "pass in proto udp from ::1 to any",
+            "pass in proto { tcp udp } from { 127.0.0.1 ::1 } to any",
             "",
             "# Block dangerous unencrypted ports (external only)",
-        ]
-        
-        for port in self.always_block:
-            rules.extend([
-                f"block in proto tcp from any to any port {port}",
-                f"block in proto udp from any to any port {port}",
-                ""
-            ])
-        
-        rules.extend([
+            "block in proto { tcp udp } from any to any port $byj_blocked",
+            "",
             "# Allow encrypted ports",
-        ])
-        
-        for port in self.always_allow:
-            rules.extend([
-                f"pass in proto tcp from any to any port {port}",
-                f"pass in proto udp from any to any port {port}",
-                ""
-            ])
+            "pass in proto { tcp udp } from any to any port $byj_allowed",
+            ""
+        ]
         
         return "\n".join(rules)
     
     def block_port(self, port: int, reason: str = "Security policy") -> bool:
         """Block a specific port"""
+        return port in self.block_ports([port], reason)
+    
+    def block_ports(self, ports: List[int], reason: str = "Security policy") -> List[int]:
+        """Block several ports with one save and one firewall update; returns the ports blocked"""
         try:
-            # Check if port is in always allow list
-            if port in self.always_allow:
-                self.logger.warning(f"Cannot block port {port} - it's in always allow list")
-                return False
-            
-            # Add to blocked ports
-            blocked_ports = self.get_blocked_ports()
-            if port not in blocked_ports:
-                blocked_ports.append(port)
-                self._save_blocked_ports(blocked_ports)
-            
-            # Apply the block
-            self._apply_port_block(port)
-            
-            self.logger.info(f"Blocked port {port} - {reason}")
-            return True
+            # Skip ports in the always allow list
+            to_block = []
+            for port in ports:
+                if port in self.ALWAYS_ALLOW:
+                    self.logger.warning(f"Cannot block port {port} - it's in always allow list")
+                else:
+                    to_block.append(port)
+            if not to_block:
+                return []
+            
+            # Add to blocked ports; ports already blocked are in the firewall too
+            with self._cache_lock:
+                blocked_ports = self.get_blocked_ports()
+                new_ports = sorted(set(to_block).difference(blocked_ports))
+                if new_ports:
+                    self._save_blocked_ports(blocked_ports + new_ports)
+            
+            if new_ports:
+                # Apply the block
+                self._apply_batch_block(new_ports)
+            
+            self.logger.info(f"Blocked ports {to_block} - {reason}")
+            return to_block
             
         except Exception as e:
-            self.logger.error(f"Failed to block port {port}: {e}")
-            return False
+            self.logger.error(f"Failed to block ports {ports}: {e}")
+            return []
     
     def unblock_port(self, port: int) -> bool:
         """Unblock a specific port"""
         try:
             # Check if port is in always block list
-            if port in self.always_block:
+            if port in self.ALWAYS_BLOCK:
                 self.logger.warning(f"Cannot unblock port {port} - it's in always block list")
                 return False
             
             # Remove from blocked ports
-            blocked_ports = self.get_blocked_ports()
-            if port in blocked_ports:
-                blocked_ports.remove(port)
-                self._save_blocked_ports(blocked_ports)
+            with self._cache_lock:
+                blocked_ports = self.get_blocked_ports()
+                if port in blocked_ports:
+                    blocked_ports.remove(port)
+                    self._save_blocked_ports(blocked_ports)
             
             # Apply the unblock
             self._apply_port_unblock(port)
@@ -276,22 +292,20 @@ class PortBlocker:
     
     def _apply_port_block(self, port: int):
         """Apply port blocking using system firewall"""
+        self._apply_batch_block([port])
+    
+    def _apply_batch_block(self, ports: List[int]):
+        """Apply port blocking for several ports with a single firewall command"""
         try:
             system = platform.system().lower()
             
             if system == "darwin":  # macOS
-                subprocess.run([
-                    "sudo", "pfctl", "-t", "byj_blocked_ports", 
-                    "-T", "add", f"0.0.0.0/0:{port}"
-                ], check=True)
+                self._load_pfctl_rules()
             elif system == "linux":
-                subprocess.run([
-                    "sudo", "iptables", "-A", "INPUT", 
-                    "-p", "tcp", "--dport", str(port), "-j", "DROP"
-                ], check=True)
+                self._ipset_add(ports)
                 
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to apply port block for {port}: {e}")
+            self.logger.error(f"Failed to apply port block for {ports}: {e}")
     
     def _apply_port_unblock(self, port: int):
         """Apply port unblocking using system firewall"""
@@ -299,14 +313,10 @@ class PortBlocker:
             system = platform.system().lower()
             
             if system == "darwin":  # macOS
-                subprocess.run([
-                    "sudo", "pfctl", "-t", "byj_blocked_ports", 
-                    "-T", "delete", f"0.0.0.0/0:{port}"
-                ], check=True)
+                self._load_pfctl_rules()
             elif system == "linux":
                 subprocess.run([
-                    "sudo", "iptables", "-D", "INPUT", 
-                    "-p", "tcp", "--dport", str(port), "-j", "DROP"
+                    "sudo", "ipset", "del", self.IPSET_NAME, str(port), "-exist"
                 ], check=True)
                 
         except subprocess.CalledProcessError as e:
@@ -314,54 +324,56 @@ class PortBlocker:
     
     def get_blocked_ports(self) -> List[int]:
         """Get list of currently blocked ports"""
+        with self._cache_lock:
+            if self._blocked_cache is None:
+                self._set_blocked_cache(self._load_blocked_ports())
+            return list(self._blocked_cache)
+    
+    def _set_blocked_cache(self, ports: List[int]):
+        """Replace the in-memory blocked port list and its lookup set"""
+        self._blocked_cache = list(ports)
+        self._blocked_set = set(ports)
+    
+    def _load_blocked_ports(self) -> List[int]:
+        """Read the blocked ports list from the encrypted file"""
         try:
-            temp_path = "temp_blocked_ports.txt"
-            if self.encryption.decrypt_file(self.blocked_ports_file, temp_path):
-                with open(temp_path, 'r') as f:
-                    ports = [int(line.strip()) for line in f if line.strip().isdigit()]
-                
-                # Clean up temp file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-                
-                return ports
-            
-            return list(self.always_block)
+            data = self.encryption.read_encrypted(self.blocked_ports_file)
+            return [int(line) for line in data.decode().split() if line.isdigit()]
             
+        except FileNotFoundError:
+            return list(self.ALWAYS_BLOCK_LIST)
         except Exception as e:
-            self.logger.error(f"Failed to get blocked ports: {e}")
-            return list(self.always_block)
+            # Keep the unreadable list aside so the next save doesn't destroy it
+            unreadable_path = f"{self.blocked_ports_file}.unreadable"
+            try:
+                os.replace(self.blocked_ports_file, unreadable_path)
+            except OSError:
+                unreadable_path = self.blocked_ports_file
+            self.logger.error(f"Failed to read blocked ports ({e!r}); falling back to the "
+                              f"always-block list, original kept at {unreadable_path}")
+            return list(self.ALWAYS_BLOCK_LIST)
     
     def _save_blocked_ports(self, ports: List[int]):
         """Save blocked ports list (encrypted)"""
-        try:
-            temp_path = "temp_blocked_ports.txt"
-            with open(temp_path, 'w') as f:
-                for port in ports:
-                    f.write(f"{port}\n")
-            
-            # Encrypt the file
-            self.encryption.encrypt_file(temp_path)
-            
-            # Move to final location
-            if os.path.exists(f"{temp_path}.encrypted"):
-                os.rename(f"{temp_path}.encrypted", self.blocked_ports_file)
-            
-            # Clean up temp file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-                
-        except Exception as e:
-            self.logger.error(f"Failed to save blocked ports: {e}")
+        with self._cache_lock:
+            self._set_blocked_cache(ports)
+            
+            try:
+                data = "".join(f"{port}\n" for port in ports).encode()
+                Path(self.blocked_ports_file).write_bytes(self.encryption.encrypt_bytes(data))
+                    
+            except Exception as e:
+                self.logger.error(f"Failed to save blocked ports: {e}")
     
     def is_port_blocked(self, port: int) -> bool:
         """Check if a port is blocked"""
-        blocked_ports = self.get_blocked_ports()
-        return port in blocked_ports
+        if self._blocked_cache is None:
+            self.get_blocked_ports()
+        return port in self._blocked_set
     
     def is_port_allowed(self, port: int) -> bool:
         """Check if a port is explicitly allowed"""
-        return port in self.always_allow
+        return port in self.ALWAYS_ALLOW
     
     def get_port_info(self, port: int) -> Dict[str, Any]:
         """Get information about a specific port"""
@@ -370,8 +382,8 @@ class PortBlocker:
             "description": self.dangerous_ports.get(port, "Unknown service"),
             "blocked": self.is_port_blocked(port),
             "allowed": self.is_port_allowed(port),
-            "dangerous": port in self.always_block,
-            "encrypted": port in self.always_allow
+            "dangerous": port in self.ALWAYS_BLOCK,
+            "encrypted": port in self.ALWAYS_ALLOW
         }
     
     def get_port_status(self) -> Dict[str, Any]:
@@ -384,8 +396,8 @@ class PortBlocker:
                 "enabled": True,
                 "total_blocked": len(blocked_ports),
                 "blocked_ports": blocked_ports,
-                "always_blocked": list(self.always_block),
-                "always_allowed": list(self.always_allow),
+                "always_blocked": self.ALWAYS_BLOCK_LIST,
+                "always_allowed": self.ALWAYS_ALLOW_LIST,
                 "system": platform.system(),
                 "last_updated": datetime.now().isoformat()
             }
@@ -400,14 +412,7 @@ class PortBlocker:
             self.logger.critical("🚨 EMERGENCY: Blocking all unencrypted ports")
             
             # Block all common unencrypted ports
-            unencrypted_ports = [
-                80, 21, 23, 25, 53, 110, 143, 161, 389, 445,
-                8080, 8000, 3000, 5000, 9000, 9090, 8888
-            ]
-            
-            for port in unencrypted_ports:
-                if not self.is_port_allowed(port):
-                    self.block_port(port, "Emergency security lockdown")
+            self.block_ports(list(self.EMERGENCY_BLOCK_PORTS), "Emergency security lockdown")
             
             self.logger.critical("✅ Emergency port blocking completed")
             return True
@@ -5,20 +5,85 @@ Encrypted firewall rules with integrity protection
 
 import os
 import json
+import threading
 import logging
+import ipaddress
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable, Set, Tuple
 from ..utils.file_encryption import FileEncryption, FirewallProtection
 
+class IPSet:
+    """Immutable set of IP addresses and CIDR networks with prefix-bucketed lookups"""
+    __slots__ = ('entries', '_hosts', '_networks')
+    
+    def __init__(self, entries: Iterable[str] = ()):
+        self.entries = frozenset(entry.strip() for entry in entries if entry.strip())
+        hosts = set(self.entries)
+        buckets: Dict[Tuple[int, int], Set[int]] = {}
+        
+        for entry in self.entries:
+            # Plain IPv4 addresses already match by string, so only CIDR and
+            # IPv6 entries need the comparatively slow ipaddress parse
+            if '/' not in entry and ':' not in entry:
+                continue
+            try:
+                network = ipaddress.ip_network(entry, strict=False)
+            except ValueError:
+                continue
+            host_bits = network.max_prefixlen - network.prefixlen
+            if host_bits == 0:
+                hosts.add(str(network.network_address))
+            else:
+                # Store each network as its address shifted past the host bits,
+                # so a lookup is one shift and one hash probe per prefix length
+                key = (network.version, host_bits)
+                buckets.setdefault(key, set()).add(int(network.network_address) >> host_bits)
+        
+        self._hosts = frozenset(hosts)
+        self._networks = tuple((version, host_bits, frozenset(prefixes))
+                               for (version, host_bits), prefixes in buckets.items())
+    
+    def __contains__(self, ip: str) -> bool:
+        if ip in self._hosts:
+            return True
+        if not self._networks:
+            return False
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+        value = int(address)
+        for version, host_bits, prefixes in self._networks:
+            if version == address.version and value >> host_bits in prefixes:
+                return True
+        return False
+    
+    def __iter__(self):
+        return iter(self.entries)
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+
 class SecureFirewallManager:
-    def __init__(self):
+    def __init__(self, encryption: FileEncryption = None):
         self.logger = logging.getLogger(__name__)
-        self.encryption = FileEncryption()
-        self.protection = FirewallProtection()
+        self.encryption = encryption or FileEncryption()
+        self.protection = FirewallProtection(self.encryption)
         self.rules_file = "data/firewall_rules.json.encrypted"
         self.blocked_ips_file = "data/blocked_ips.txt.encrypted"
         self.whitelist_file = "data/whitelist.txt.encrypted"
         
+        # Decrypted IP lists, revalidated against the file mtime
+        self._blocked_set: Optional[IPSet] = None
+        self._blocked_mtime: Optional[int] = None
+        self._whitelist_set: Optional[IPSet] = None
+        self._whitelist_mtime: Optional[int] = None
+        
+        # Serializes blocklist writers; readers use whichever IPSet is current
+        self._write_lock = threading.Lock()
+        
         # Initialize secure firewall
         self._initialize_secure_firewall()
     
@@ -26,7 +91,7 @@ class SecureFirewallManager:
         """Initialize the secure firewall system"""
         try:
             # Create data directory if it doesn't exist
-            os.makedirs("data", exist_ok=True)
+            Path("data").mkdir(parents=True, exist_ok=True)
             
             # Initialize file protection
             self.protection.protect_firewall_rules()
@@ -51,15 +116,9 @@ class SecureFirewallManager:
                 "172.16.0.25"      # Example threat IP
             ]
             
-            # Create blocked IPs file
+            # Create encrypted blocked IPs file
             blocked_content = "\n".join(blocked_ips)
-            blocked_path = "data/blocked_ips.txt"
-            
-            with open(blocked_path, 'w') as f:
-                f.write(blocked_content)
-            
-            # Encrypt the file
-            self.encryption.encrypt_file(blocked_path)
+            self.encryption.write_encrypted(self.blocked_ips_file, blocked_content.encode())
             
             self.logger.info("Initial blocked IPs list created and encrypted")
             
@@ -75,53 +134,71 @@ class SecureFirewallManager:
                 "10.0.0.1"         # Trusted network
             ]
             
-            # Create whitelist file
+            # Create encrypted whitelist file
             whitelist_content = "\n".join(whitelist_ips)
-            whitelist_path = "data/whitelist.txt"
-            
-            with open(whitelist_path, 'w') as f:
-                f.write(whitelist_content)
-            
-            # Encrypt the file
-            self.encryption.encrypt_file(whitelist_path)
+            self.encryption.write_encrypted(self.whitelist_file, whitelist_content.encode())
             
             self.logger.info("Whitelist created and encrypted")
             
         except Exception as e:
             self.logger.error(f"Failed to create whitelist: {e}")
     
+    def _read_ip_file(self, path: str) -> Tuple[IPSet, int]:
+        """Decrypt an IP list file in memory and return its entries with the file mtime"""
+        mtime = os.stat(path).st_mtime_ns
+        data = self.encryption.read_encrypted(path)
+        return IPSet(data.decode().split('\n')), mtime
+    
+    def _load_blocked(self) -> IPSet:
+        """Load the blocked IPs into memory"""
+        self._blocked_set, self._blocked_mtime = self._read_ip_file(self.blocked_ips_file)
+        return self._blocked_set
+    
+    def _load_whitelist(self) -> IPSet:
+        """Load the whitelisted IPs into memory"""
+        self._whitelist_set, self._whitelist_mtime = self._read_ip_file(self.whitelist_file)
+        return self._whitelist_set
+    
+    def _current_blocked(self) -> IPSet:
+        """Return the cached blocked IPs, reloading if the file changed on disk"""
+        if self._blocked_set is None or os.stat(self.blocked_ips_file).st_mtime_ns != self._blocked_mtime:
+            return self._load_blocked()
+        return self._blocked_set
+    
+    def _current_whitelist(self) -> IPSet:
+        """Return the cached whitelist, reloading if the file changed on disk"""
+        if self._whitelist_set is None or os.stat(self.whitelist_file).st_mtime_ns != self._whitelist_mtime:
+            return self._load_whitelist()
+        return self._whitelist_set
+    
+    def _write_blocked(self, ips: Set[str]):
+        """Rewrite the encrypted blocklist and swap in a new cached IPSet"""
+        blocked = IPSet(ips)
+        # Sorted so identical lists always produce identical file contents
+        self.encryption.write_encrypted(self.blocked_ips_file, '\n'.join(sorted(ips)).encode())
+        # Publish the set before its mtime: a reader racing the swap at worst
+        # sees a stale mtime and reloads, never a stale set marked current
+        self._blocked_set = blocked
+        self._blocked_mtime = os.stat(self.blocked_ips_file).st_mtime_ns
+    
     def add_blocked_ip(self, ip_address: str, reason: str = "Security threat") -> bool:
         """Add IP to blocked list (encrypted)"""
         try:
-            # Decrypt current blocked IPs
-            temp_path = "temp_blocked_ips.txt"
-            if not self.encryption.decrypt_file(self.blocked_ips_file, temp_path):
-                return False
+            # Resubmitted IPs are a no-op answered from the cache
+            if ip_address in self._current_blocked().entries:
+                return True
             
-            # Read current IPs
-            with open(temp_path, 'r') as f:
-                current_ips = f.read().strip().split('\n')
-            
-            # Add new IP if not already present
-            if ip_address not in current_ips:
-                current_ips.append(ip_address)
-                
-                # Write updated list
-                with open(temp_path, 'w') as f:
-                    f.write('\n'.join(current_ips))
-                
-                # Re-encrypt
-                self.encryption.encrypt_file(temp_path)
+            with self._write_lock:
+                current_ips = set(self._current_blocked())
                 
-                # Move encrypted file to correct location
-                if os.path.exists(f"{temp_path}.encrypted"):
-                    os.rename(f"{temp_path}.encrypted", self.blocked_ips_file)
-                
-                self.logger.info(f"Added blocked IP: {ip_address} - {reason}")
-            
-            # Clean up temp file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+                # Add new IP if not already present
+                if ip_address not in current_ips:
+                    current_ips.add(ip_address)
+                    
+                    # Write updated list straight to the encrypted file
+                    self._write_blocked(current_ips)
+                    
+                    self.logger.info(f"Added blocked IP: {ip_address} - {reason}")
             
             return True
             
@@ -132,35 +209,21 @@ class SecureFirewallManager:
     def remove_blocked_ip(self, ip_address: str) -> bool:
         """Remove IP from blocked list"""
         try:
-            # Decrypt current blocked IPs
-            temp_path = "temp_blocked_ips.txt"
-            if not self.encryption.decrypt_file(self.blocked_ips_file, temp_path):
-                return False
-            
-            # Read current IPs
-            with open(temp_path, 'r') as f:
-                current_ips = f.read().strip().split('\n')
+            # Nothing to rewrite when the IP isn't listed
+            if ip_address not in self._current_blocked().entries:
+                return True
             
-            # Remove IP if present
-            if ip_address in current_ips:
-                current_ips.remove(ip_address)
+            with self._write_lock:
+                current_ips = set(self._current_blocked())
                 
-                # Write updated list
-                with open(temp_path, 'w') as f:
-                    f.write('\n'.join(current_ips))
-                
-                # Re-encrypt
-                self.encryption.encrypt_file(temp_path)
-                
-                # Move encrypted file to correct location
-                if os.path.exists(f"{temp_path}.encrypted"):
-                    os.rename(f"{temp_path}.encrypted", self.blocked_ips_file)
-                
-                self.logger.info(f"Removed blocked IP: {ip_address}")
-            
-            # Clean up temp file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+                # Remove IP if present
+                if ip_address in current_ips:
+                    current_ips.discard(ip_address)
+                    
+                    # Write updated list straight to the encrypted file
+                    self._write_blocked(current_ips)
+                    
+                    self.logger.info(f"Removed blocked IP: {ip_address}")
             
             return True
             
@@ -171,18 +234,7 @@ class SecureFirewallManager:
     def get_blocked_ips(self) -> List[str]:
         """Get list of blocked IPs (decrypted)"""
         try:
-            temp_path = "temp_blocked_ips.txt"
-            if self.encryption.decrypt_file(self.blocked_ips_file, temp_path):
-                with open(temp_path, 'r') as f:
-                    ips = f.read().strip().split('\n')
-                
-                # Clean up temp file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-                
-                return [ip for ip in ips if ip.strip()]
-            
-            return []
+            return sorted(self._current_blocked())
             
         except Exception as e:
             self.logger.error(f"Failed to get blocked IPs: {e}")
@@ -190,40 +242,36 @@ class SecureFirewallManager:
     
     def is_ip_blocked(self, ip_address: str) -> bool:
         """Check if IP is blocked"""
-        blocked_ips = self.get_blocked_ips()
-        return ip_address in blocked_ips
+        try:
+            return ip_address in self._current_blocked()
+        except Exception as e:
+            self.logger.error(f"Failed to check blocklist for {ip_address}: {e}")
+            return False
     
     def is_ip_whitelisted(self, ip_address: str) -> bool:
         """Check if IP is whitelisted"""
         try:
-            temp_path = "temp_whitelist.txt"
-            if self.encryption.decrypt_file(self.whitelist_file, temp_path):
-                with open(temp_path, 'r') as f:
-                    whitelist_ips = f.read().strip().split('\n')
-                
-                # Clean up temp file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-                
-                return ip_address in whitelist_ips
-            
-            return False
+            return ip_address in self._current_whitelist()
             
         except Exception as e:
             self.logger.error(f"Failed to check whitelist for {ip_address}: {e}")
             return False
     
-    def verify_firewall_integrity(self) -> bool:
+    def verify_firewall_integrity(self, blocked_integrity: Optional[bool] = None) -> bool:
         """Verify firewall files haven't been tampered with"""
         try:
-            # Check firewall rules integrity
-            rules_integrity = self.protection.verify_firewall_integrity()
-            
-            # Check blocked IPs integrity
-            blocked_integrity = self.encryption.verify_file_integrity(self.blocked_ips_file)
-            
-            # Check whitelist integrity
-            whitelist_integrity = self.encryption.verify_file_integrity(self.whitelist_file)
+            # Check firewall rules, blocked IPs and whitelist integrity concurrently;
+            # callers that already hashed the blocklist pass the result in
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                rules_check = executor.submit(self.protection.verify_firewall_integrity)
+                whitelist_check = executor.submit(self.encryption.verify_file_integrity, self.whitelist_file)
+                if blocked_integrity is None:
+                    blocked_integrity = executor.submit(
+                        self.encryption.verify_file_integrity, self.blocked_ips_file
+                    ).result()
+                
+                rules_integrity = rules_check.result()
+                whitelist_integrity = whitelist_check.result()
             
             all_integrity = rules_integrity and blocked_integrity and whitelist_integrity
             
@@ -241,12 +289,21 @@ class SecureFirewallManager:
     def get_firewall_status(self) -> Dict[str, Any]:
         """Get comprehensive firewall status"""
         try:
-            blocked_ips = self.get_blocked_ips()
+            # Read the blocklist once for both its contents and its integrity hash
+            try:
+                mtime = os.stat(self.blocked_ips_file).st_mtime_ns
+                data, blocked_integrity = self.encryption.read_and_verify(self.blocked_ips_file)
+                self._blocked_set = IPSet(data.decode().split('\n'))
+                self._blocked_mtime = mtime
+                blocked_ips = sorted(self._blocked_set)
+            except Exception as e:
+                self.logger.error(f"Failed to read blocked IPs: {e}")
+                blocked_ips, blocked_integrity = [], False
             
             status = {
                 "timestamp": datetime.now().isoformat(),
                 "encrypted": True,
-                "integrity_verified": self.verify_firewall_integrity(),
+                "integrity_verified": self.verify_firewall_integrity(blocked_integrity),
                 "blocked_ips_count": len(blocked_ips),
                 "blocked_ips": blocked_ips[:10],  # Show first 10 for security
                 "whitelist_active": True,
@@ -1,101 +1,136 @@
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
-from typing import Dict, Set, List, Optional, Any
-from pathlib import Path
-
-@dataclass
-class ProcessInfo:
-    """Detailed information about a process"""
-    pid: int
-    name: str = None
-    path: str = None
-    command_line: str = None
-    username: str = None
-    creation_time: datetime = None
-    cpu_percent: float = 0
-    memory_percent: float = 0
-    status: str = None
-    tcp_connections: int = 0
-    udp_connections: int = 0
-    read_bytes: int = 0
-    write_bytes: int = 0
-    
-    def to_dict(self):
-        return {k: str(v) if isinstance(v, datetime) else v 
-                for k, v in asdict(self).items() if v is not None}
-
-@dataclass
-class TrafficSample:
-    """Network traffic sample data"""
-    timestamp: datetime
-    source_port: int
-    destination_port: int
-    protocol: str
-    payload_size: int
-    is_encrypted: bool
-    sample_data: str = None
-    packet_type: str = None
-    
-    def to_dict(self):
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
-
-@dataclass
-class SecurityAssessment:
-    """Security assessment results"""
-    risk_level: str
-    risk_factors: List[str] = field(default_factory=list)
-    recommendation: str = None
-    threat_indicators: List[str] = field(default_factory=list)
-    trust_score: float = 0.0
-    detection_rules_triggered: List[str] = field(default_factory=list)
-    
-    def to_dict(self):
-        return asdict(self)
-
-@dataclass
-class NetworkEndpoint:
-    """Enhanced network endpoint information"""
-    host: str
-    port: int
-    protocol: str
-    process_info: Optional[ProcessInfo] = None
-    traffic_samples: List[TrafficSample] = field(default_factory=list)
-    security_assessment: Optional[SecurityAssessment] = None
-    latency: float = 0
-    is_safe: bool = False
-    country: str = None
-    city: str = None
-    organization: str = None
-    device_type: str = None
-    open_ports: List[int] = field(default_factory=list)
-    reverse_dns: str = None
-    is_private: bool = False
-    packet_loss: float = 0
-    rtt_stats: dict = field(default_factory=dict)
-    last_seen: datetime = None
-    first_seen: datetime = None
-    connection_count: int = 0
-    bytes_sent: int = 0
-    bytes_received: int = 0
-    avg_packet_size: float = 0
-    connection_state: str = None
-    encryption_type: str = None
-    certificate_info: dict = field(default_factory=dict)
-    dns_queries: List[str] = field(default_factory=list)
-    http_requests: List[dict] = field(default_factory=list)
-    behavioral_pattern: str = None
-    
-    def to_dict(self):
-        data = asdict(self)
-        for key in ['last_seen', 'first_seen']:
-            if data[key]:
-                data[key] = data[key].isoformat()
-        if self.process_info:
-            data['process_info'] = self.process_info.to_dict()
-        if self.traffic_samples:
-            data['traffic_samples'] = [sample.to_dict() for sample in self.traffic_samples]
-        if self.security_assessment:
-            data['security_assessment'] = self.security_assessment.to_dict()
-        return {k: v for k, v in data.items() if v is not None}
\ No newline at end of file
+import sys
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Dict, Set, List, Optional, Any, Union, get_args, get_origin
+from pathlib import Path
+
+# slots=True needs Python 3.10+; older interpreters fall back to regular dataclasses
+_slotted_dataclass = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+def _unwrap_optional(field_type):
+    """Optional[X] -> X; other annotations unchanged"""
+    if get_origin(field_type) is Union:
+        args = [arg for arg in get_args(field_type) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return field_type
+
+def _value_expression(field_type, datetime_format: str) -> str:
+    """Source expression that serializes `value` for a field of the given type"""
+    origin = get_origin(field_type) or field_type
+    if field_type is datetime:
+        return 'str(value)' if datetime_format == 'str' else 'value.isoformat()'
+    if hasattr(field_type, 'to_dict'):
+        return 'value.to_dict()'
+    if origin is list:
+        item_type = (get_args(field_type) or (None,))[0]
+        if hasattr(item_type, 'to_dict'):
+            return '[item.to_dict() for item in value]'
+        return 'value.copy()'
+    if origin is dict:
+        return 'value.copy()'
+    return 'value'
+
+def codegen_to_dict(skip_none: bool = False, datetime_format: str = 'isoformat'):
+    """Class decorator that compiles a flat to_dict from the dataclass fields"""
+    # skip_none drops None values instead of serializing them as null
+    def decorate(cls):
+        lines = ['def to_dict(self):', '    out = {}']
+        for f in fields(cls):
+            field_type = _unwrap_optional(f.type)
+            expression = _value_expression(field_type, datetime_format)
+            if expression == 'value' and not skip_none:
+                lines.append(f'    out[{f.name!r}] = self.{f.name}')
+                continue
+            
+            lines.append(f'    value = self.{f.name}')
+            lines.append('    if value is not None:')
+            lines.append(f'        out[{f.name!r}] = {expression}')
+            if not skip_none:
+                lines.append('    else:')
+                lines.append(f'        out[{f.name!r}] = None')
+        lines.append('    return out')
+        
+        namespace = {}
+        exec(compile('\n'.join(lines), f'<{cls.__name__}.to_dict>', 'exec'), namespace)
+        to_dict = namespace['to_dict']
+        to_dict.__qualname__ = f'{cls.__name__}.to_dict'
+        cls.to_dict = to_dict
+        return cls
+    return decorate
+
+@codegen_to_dict(skip_none=True, datetime_format='str')
+@_slotted_dataclass
+class ProcessInfo:
+    """Detailed information about a process"""
+    pid: int
+    name: str = None
+    path: str = None
+    command_line: str = None
+    username: str = None
+    creation_time: datetime = None
+    cpu_percent: float = 0
+    memory_percent: float = 0
+    status: str = None
+    tcp_connections: int = 0
+    udp_connections: int = 0
+    read_bytes: int = 0
+    write_bytes: int = 0
+
+@codegen_to_dict()
+@_slotted_dataclass
+class TrafficSample:
+    """Network traffic sample data"""
+    timestamp: datetime
+    source_port: int
+    destination_port: int
+    protocol: str
+    payload_size: int
+    is_encrypted: bool
+    sample_data: str = None
+    packet_type: str = None
+
+@codegen_to_dict()
+@_slotted_dataclass
+class SecurityAssessment:
+    """Security assessment results"""
+    risk_level: str
+    risk_factors: List[str] = field(default_factory=list)
+    recommendation: str = None
+    threat_indicators: List[str] = field(default_factory=list)
+    trust_score: float = 0.0
+    detection_rules_triggered: List[str] = field(default_factory=list)
+
+@codegen_to_dict(skip_none=True)
+@_slotted_dataclass
+class NetworkEndpoint:
+    """Enhanced network endpoint information"""
+    host: str
+    port: int
+    protocol: str
+    process_info: Optional[ProcessInfo] = None
+    traffic_samples: List[TrafficSample] = field(default_factory=list)
+    security_assessment: Optional[SecurityAssessment] = None
+    latency: float = 0
+    is_safe: bool = False
+    country: str = None
+    city: str = None
+    organization: str = None
+    device_type: str = None
+    open_ports: List[int] = field(default_factory=list)
+    reverse_dns: str = None
+    is_private: bool = False
+    packet_loss: float = 0
+    rtt_stats: dict = field(default_factory=dict)
+    last_seen: datetime = None
+    first_seen: datetime = None
+    connection_count: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    avg_packet_size: float = 0
+    connection_state: str = None
+    encryption_type: str = None
+    certificate_info: dict = field(default_factory=dict)
+    dns_queries: List[str] = field(default_factory=list)
+    http_requests: List[dict] = field(default_factory=list)
+    behavioral_pattern: str = None
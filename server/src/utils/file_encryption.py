@@ -4,20 +4,64 @@ Protects critical security files from unauthorized modification
 """
 
 import os
-import json
-import hashlib
 import base64
-from cryptography.fernet import Fernet
+import orjson
+import contextlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+import hashlib
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import logging
 
+# AES-GCM nonce length; every ciphertext is stored as nonce || ciphertext || tag
+NONCE_SIZE = 12
+
+# GCM authentication tag length, stored after the ciphertext
+TAG_SIZE = 16
+
+# Files written before the switch to AES-GCM hold Fernet tokens, which start with this
+FERNET_TOKEN_PREFIX = b'gAAAA'
+
+# Read size used when streaming files through the cipher
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Upper bound on threads used by the batch encrypt/decrypt helpers
+MAX_CRYPTO_WORKERS = 8
+
+@functools.lru_cache(maxsize=4)
+def _derive_key(master_password: str) -> bytes:
+    """Derive a raw 256-bit AES key from master password (once per process)"""
+    password = master_password.encode()
+    salt = b'bigyellowjacket_salt_2024'  # In production, use random salt
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=100000,
+    )
+    return kdf.derive(password)
+
+def _sha256_file(f) -> str:
+    """Hex SHA-256 of an open binary file, streamed rather than read whole"""
+    if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+    digest = hashlib.sha256()
+    while chunk := f.read(STREAM_CHUNK_SIZE):
+        digest.update(chunk)
+    return digest.hexdigest()
+
 class FileEncryption:
     def __init__(self, master_password: str = None):
         """Initialize file encryption with master password"""
         self.master_password = master_password or "BigYellowJacket2024!Secure"
-        self.key = self._derive_key()
-        self.cipher = Fernet(self.key)
+        self.key = _derive_key(self.master_password)
+        self.cipher = AESGCM(self.key)
         self.logger = logging.getLogger(__name__)
         
         # Files that should be encrypted
@@ -30,49 +74,82 @@ class FileEncryption:
             "security_config.json"
         ]
     
-    def _derive_key(self) -> bytes:
-        """Derive encryption key from master password"""
-        password = self.master_password.encode()
-        salt = b'bigyellowjacket_salt_2024'  # In production, use random salt
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password))
-        return key
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """Encrypt an in-memory buffer"""
+        nonce = os.urandom(NONCE_SIZE)
+        return nonce + self.cipher.encrypt(nonce, data, None)
+    
+    def decrypt_bytes(self, data: bytes) -> bytes:
+        """Decrypt an in-memory buffer produced by encrypt_bytes or encrypt_file"""
+        legacy = self._decrypt_legacy(data)
+        if legacy is not None:
+            return legacy
+        return self.cipher.decrypt(data[:NONCE_SIZE], data[NONCE_SIZE:], None)
+    
+    def _decrypt_legacy(self, data: bytes) -> Optional[bytes]:
+        """Decrypt a Fernet token from before AES-GCM, or None if data isn't one"""
+        if not data.startswith(FERNET_TOKEN_PREFIX):
+            return None
+        try:
+            # The Fernet key was the same PBKDF2 output, urlsafe base64 encoded
+            return Fernet(base64.urlsafe_b64encode(self.key)).decrypt(data)
+        except InvalidToken:
+            return None
+    
+    def _migrate_legacy(self, path: str, data: bytes, plaintext: bytes):
+        """Re-encrypt a legacy Fernet file as AES-GCM in place"""
+        if self._decrypt_legacy(data) is None:
+            return
+        try:
+            self.write_encrypted(path, plaintext)
+            # The old token was authenticated, so its stored hash moves to the new ciphertext
+            hash_file = Path(f"{path}.hash")
+            if hash_file.exists():
+                hash_file.write_text(hashlib.sha256(Path(path).read_bytes()).hexdigest())
+            self.logger.info(f"Migrated legacy Fernet file to AES-GCM: {path}")
+        except Exception as e:
+            self.logger.error(f"Failed to migrate legacy Fernet file {path}: {e}")
     
-    def encrypt_file(self, file_path: str) -> bool:
+    def read_encrypted(self, path: str) -> bytes:
+        """Read and decrypt an encrypted file without writing plaintext to disk"""
+        data = Path(path).read_bytes()
+        plaintext = self.decrypt_bytes(data)
+        self._migrate_legacy(path, data, plaintext)
+        return plaintext
+    
+    def write_encrypted(self, path: str, data: bytes):
+        """Encrypt a buffer and atomically replace the file at path"""
+        temp_path = Path(f"{path}.tmp")
+        temp_path.write_bytes(self.encrypt_bytes(data))
+        temp_path.replace(path)
+    
+    def encrypt_file(self, file_path: str, *, keep_backup: bool = False) -> bool:
         """Encrypt a file and store with .encrypted extension"""
         try:
-            if not os.path.exists(file_path):
-                self.logger.warning(f"File not found: {file_path}")
-                return False
-            
-            # Read original file
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
-            
-            # Encrypt data
-            encrypted_data = self.cipher.encrypt(file_data)
-            
-            # Write encrypted file
+            # Stream the file through AES-GCM in the same nonce || ciphertext || tag
+            # layout encrypt_bytes produces, holding only one chunk in memory
             encrypted_path = f"{file_path}.encrypted"
-            with open(encrypted_path, 'wb') as f:
-                f.write(encrypted_data)
+            nonce = os.urandom(NONCE_SIZE)
+            encryptor = Cipher(algorithms.AES(self.key), modes.GCM(nonce)).encryptor()
+            with open(file_path, 'rb') as src, open(encrypted_path, 'wb') as dst:
+                dst.write(nonce)
+                while chunk := src.read(STREAM_CHUNK_SIZE):
+                    dst.write(encryptor.update(chunk))
+                dst.write(encryptor.finalize())
+                dst.write(encryptor.tag)
             
-            # Create backup of original
-            backup_path = f"{file_path}.backup"
-            with open(backup_path, 'wb') as f:
-                f.write(file_data)
-            
-            # Remove original file
-            os.remove(file_path)
+            # Keep the plaintext original as a backup only when asked to
+            if keep_backup:
+                os.replace(file_path, f"{file_path}.backup")
+            else:
+                os.remove(file_path)
             
             self.logger.info(f"File encrypted: {file_path} -> {encrypted_path}")
             return True
             
+        except FileNotFoundError:
+            self.logger.warning(f"File not found: {file_path}")
+            return False
         except Exception as e:
             self.logger.error(f"Failed to encrypt {file_path}: {e}")
             return False
@@ -80,71 +157,113 @@ class FileEncryption:
     def decrypt_file(self, encrypted_path: str, output_path: str = None) -> bool:
         """Decrypt a file"""
         try:
-            if not os.path.exists(encrypted_path):
-                self.logger.warning(f"Encrypted file not found: {encrypted_path}")
-                return False
-            
-            # Read encrypted file
-            with open(encrypted_path, 'rb') as f:
-                encrypted_data = f.read()
-            
-            # Decrypt data
-            decrypted_data = self.cipher.decrypt(encrypted_data)
-            
-            # Write decrypted file
             if output_path is None:
                 output_path = encrypted_path.replace('.encrypted', '')
             
-            with open(output_path, 'wb') as f:
-                f.write(decrypted_data)
+            # Legacy Fernet files are whole-file tokens; decrypt them in one go
+            with open(encrypted_path, 'rb') as src:
+                is_legacy = src.read(len(FERNET_TOKEN_PREFIX)) == FERNET_TOKEN_PREFIX
+            if is_legacy:
+                temp_path = f"{output_path}.tmp"
+                Path(temp_path).write_bytes(self.read_encrypted(encrypted_path))
+                os.replace(temp_path, output_path)
+                self.logger.info(f"File decrypted: {encrypted_path} -> {output_path}")
+                return True
+            
+            # Stream the ciphertext into a temp file and only move it into place
+            # once the GCM tag has verified
+            temp_path = f"{output_path}.tmp"
+            with open(encrypted_path, 'rb') as src, open(temp_path, 'wb') as dst:
+                try:
+                    remaining = os.fstat(src.fileno()).st_size - NONCE_SIZE - TAG_SIZE
+                    if remaining < 0:
+                        raise ValueError("encrypted file is truncated")
+                    nonce = src.read(NONCE_SIZE)
+                    src.seek(-TAG_SIZE, os.SEEK_END)
+                    tag = src.read(TAG_SIZE)
+                    src.seek(NONCE_SIZE)
+                    
+                    decryptor = Cipher(algorithms.AES(self.key), modes.GCM(nonce, tag)).decryptor()
+                    while remaining > 0:
+                        chunk = src.read(min(STREAM_CHUNK_SIZE, remaining))
+                        remaining -= len(chunk)
+                        dst.write(decryptor.update(chunk))
+                    dst.write(decryptor.finalize())
+                except Exception:
+                    dst.close()
+                    os.remove(temp_path)
+                    raise
+            os.replace(temp_path, output_path)
             
             self.logger.info(f"File decrypted: {encrypted_path} -> {output_path}")
             return True
             
+        except FileNotFoundError:
+            self.logger.warning(f"Encrypted file not found: {encrypted_path}")
+            return False
         except Exception as e:
             self.logger.error(f"Failed to decrypt {encrypted_path}: {e}")
             return False
     
+    def encrypt_files(self, paths: List[str], *, keep_backup: bool = False) -> List[bool]:
+        """Encrypt several files concurrently"""
+        if not paths:
+            return []
+        encrypt = functools.partial(self.encrypt_file, keep_backup=keep_backup)
+        with ThreadPoolExecutor(max_workers=min(MAX_CRYPTO_WORKERS, len(paths))) as executor:
+            return list(executor.map(encrypt, paths))
+    
+    def decrypt_files(self, paths: List[str]) -> List[bool]:
+        """Decrypt several files concurrently next to their encrypted copies"""
+        if not paths:
+            return []
+        with ThreadPoolExecutor(max_workers=min(MAX_CRYPTO_WORKERS, len(paths))) as executor:
+            return list(executor.map(self.decrypt_file, paths))
+    
     def verify_file_integrity(self, file_path: str) -> bool:
         """Verify file hasn't been tampered with"""
         try:
-            if not os.path.exists(file_path):
-                return False
-            
-            # Calculate file hash
+            # Calculate file hash without loading the whole file into memory
             with open(file_path, 'rb') as f:
-                file_data = f.read()
-            
-            file_hash = hashlib.sha256(file_data).hexdigest()
+                file_hash = _sha256_file(f)
             
-            # Check against stored hash (in production, store hashes securely)
-            hash_file = f"{file_path}.hash"
-            if os.path.exists(hash_file):
-                with open(hash_file, 'r') as f:
-                    stored_hash = f.read().strip()
-                
-                return file_hash == stored_hash
-            else:
-                # Store hash for future verification
-                with open(hash_file, 'w') as f:
-                    f.write(file_hash)
-                return True
+            return self._check_stored_hash(file_path, file_hash)
                 
+        except FileNotFoundError:
+            return False
         except Exception as e:
             self.logger.error(f"Failed to verify integrity of {file_path}: {e}")
             return False
     
+    def _check_stored_hash(self, file_path: str, file_hash: str) -> bool:
+        """Compare a file hash with its stored .hash, recording it on first use"""
+        # Check against stored hash (in production, store hashes securely)
+        hash_file = Path(f"{file_path}.hash")
+        try:
+            stored_hash = hash_file.read_text().strip()
+        except FileNotFoundError:
+            # Store hash for future verification
+            hash_file.write_text(file_hash)
+            return True
+        
+        return file_hash == stored_hash
+    
+    def read_and_verify(self, path: str) -> Tuple[bytes, bool]:
+        """Decrypt an encrypted file and verify its integrity from a single read"""
+        encrypted_data = Path(path).read_bytes()
+        is_valid = self._check_stored_hash(path, hashlib.sha256(encrypted_data).hexdigest())
+        plaintext = self.decrypt_bytes(encrypted_data)
+        if is_valid:
+            self._migrate_legacy(path, encrypted_data, plaintext)
+        return plaintext, is_valid
+    
     def protect_security_files(self, data_dir: str = "data") -> bool:
         """Encrypt all security-critical files"""
-        success_count = 0
-        total_files = 0
+        paths = [os.path.join(data_dir, filename) for filename in self.protected_files]
+        paths = [path for path in paths if os.path.exists(path)]
         
-        for filename in self.protected_files:
-            file_path = os.path.join(data_dir, filename)
-            if os.path.exists(file_path):
-                total_files += 1
-                if self.encrypt_file(file_path):
-                    success_count += 1
+        total_files = len(paths)
+        success_count = sum(self.encrypt_files(paths))
         
         self.logger.info(f"Protected {success_count}/{total_files} security files")
         return success_count == total_files
@@ -153,15 +272,14 @@ class FileEncryption:
         """Create encrypted configuration file"""
         try:
             # Convert to JSON
-            json_data = json.dumps(config_data, indent=2)
+            json_data = orjson.dumps(config_data, option=orjson.OPT_INDENT_2)
             
             # Encrypt
-            encrypted_data = self.cipher.encrypt(json_data.encode())
+            encrypted_data = self.encrypt_bytes(json_data)
             
             # Save encrypted config
             config_path = "secure_config.encrypted"
-            with open(config_path, 'wb') as f:
-                f.write(encrypted_data)
+            Path(config_path).write_bytes(encrypted_data)
             
             self.logger.info(f"Secure config created: {config_path}")
             return config_path
@@ -173,18 +291,18 @@ class FileEncryption:
     def load_secure_config(self, config_path: str) -> dict:
         """Load and decrypt configuration file"""
         try:
-            if not os.path.exists(config_path):
-                return {}
-            
             # Read encrypted file
-            with open(config_path, 'rb') as f:
-                encrypted_data = f.read()
+            try:
+                encrypted_data = Path(config_path).read_bytes()
+            except FileNotFoundError:
+                return {}
             
-            # Decrypt
-            decrypted_data = self.cipher.decrypt(encrypted_data)
+            # Decrypt, moving legacy files over to AES-GCM
+            decrypted_data = self.decrypt_bytes(encrypted_data)
+            self._migrate_legacy(config_path, encrypted_data, decrypted_data)
             
             # Parse JSON
-            config = json.loads(decrypted_data.decode())
+            config = orjson.loads(decrypted_data)
             return config
             
         except Exception as e:
@@ -193,8 +311,8 @@ class FileEncryption:
 
 # Firewall Protection System
 class FirewallProtection:
-    def __init__(self):
-        self.encryption = FileEncryption()
+    def __init__(self, encryption: FileEncryption = None):
+        self.encryption = encryption or FileEncryption()
         self.logger = logging.getLogger(__name__)
     
     def protect_firewall_rules(self) -> bool:
@@ -228,14 +346,12 @@ class FirewallProtection:
             }
             
             # Save encrypted rules
-            rules_path = "data/firewall_rules.json"
-            os.makedirs(os.path.dirname(rules_path), exist_ok=True)
-            
-            with open(rules_path, 'w') as f:
-                json.dump(firewall_rules, f, indent=2)
+            rules_path = Path("data/firewall_rules.json")
+            rules_path.parent.mkdir(parents=True, exist_ok=True)
+            rules_path.write_bytes(orjson.dumps(firewall_rules, option=orjson.OPT_INDENT_2))
             
             # Encrypt the rules file
-            return self.encryption.encrypt_file(rules_path)
+            return self.encryption.encrypt_file(str(rules_path))
             
         except Exception as e:
             self.logger.error(f"Failed to protect firewall rules: {e}")
@@ -245,8 +361,6 @@ class FirewallProtection:
         """Verify firewall rules haven't been tampered with"""
         try:
             encrypted_path = "data/firewall_rules.json.encrypted"
-            if not os.path.exists(encrypted_path):
-                return False
             
             # Decrypt and verify
             temp_path = "temp_firewall_rules.json"
@@ -255,7 +369,7 @@ class FirewallProtection:
                 is_valid = self.encryption.verify_file_integrity(temp_path)
                 
                 # Clean up temp file
-                if os.path.exists(temp_path):
+                with contextlib.suppress(FileNotFoundError):
                     os.remove(temp_path)
                 
                 return is_valid
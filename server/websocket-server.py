@@ -1,23 +1,26 @@
 #!/usr/bin/env python3
 import asyncio
-import json
+import orjson
 import websockets
 
+# Messages sent to every client on connect, serialized once at startup
+WELCOME_MESSAGE = orjson.dumps({'message_type': 'welcome', 'data': {'message': 'welcome'}}).decode()
+INITIAL_STATE_MESSAGE = orjson.dumps({
+    'message_type': 'initial_state',
+    'data': {
+        'metrics': {'system': {'cpu': {'percent': 25.5}, 'memory': {'percent': 50.0}}},
+        'active_connections': [],
+        'blocked_ips': [],
+        'alerts': []
+    }
+}).decode()
+
 async def handle_client(websocket, path):
     print('WebSocket client connected')
-    await websocket.send(json.dumps({'message_type': 'welcome', 'data': {'message': 'welcome'}}))
+    await websocket.send(WELCOME_MESSAGE)
     
     # Send initial state
-    initial_payload = {
-        'message_type': 'initial_state',
-        'data': {
-            'metrics': {'system': {'cpu': {'percent': 25.5}, 'memory': {'percent': 50.0}}},
-            'active_connections': [],
-            'blocked_ips': [],
-            'alerts': []
-        }
-    }
-    await websocket.send(json.dumps(initial_payload))
+    await websocket.send(INITIAL_STATE_MESSAGE)
     
     # Keep connection alive
     try: